@@ -0,0 +1,53 @@
+"""Shared helpers for the benchmark scripts in this directory"""
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Let the scripts import the solver modules from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LETTERS = "eeeeeeeeeeeeaaaaaaaaaiiiiiiiiioooooooonnnnnnrrrrrrttttttllllssssuuuu" \
+          "ddddgggbbccmmppffhhvvwwyykjxqz"
+
+
+def synthetic_words(count, seed=0, min_len=3, max_len=12):
+    """Return count distinct pseudo-English words with a shared-suffix bias"""
+    rng = random.Random(seed)
+    suffixes = ["", "", "", "s", "ed", "ing", "er", "ly", "tion", "ness"]
+    words = set()
+    while len(words) < count:
+        stem = "".join(rng.choice(LETTERS)
+                       for _ in range(rng.randint(min_len, max_len - 4)))
+        words.add(stem + rng.choice(suffixes))
+    return sorted(words)
+
+
+def random_board(n, seed=0):
+    """Return a seeded NxN board drawn from English letter frequencies"""
+    rng = random.Random(seed)
+    board = [[rng.choice(LETTERS) for _ in range(n)] for _ in range(n)]
+    return [["qu" if cell == "q" else cell for cell in row] for row in board]
+
+
+def timed(func, *args, **kwargs):
+    """Call func and return (result, elapsed seconds)"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def traced(func, *args, **kwargs):
+    """Call func and return (result, peak bytes allocated while it ran)"""
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def mib(nbytes):
+    return nbytes / (1024 * 1024)
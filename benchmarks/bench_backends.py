@@ -0,0 +1,66 @@
+"""
+Compare the dictionary index backends on build time, memory and solve time
+
+Build time and memory (tracemalloc peak while building) are measured for
+each backend from the same word list; solve time is the mean over a set
+of seeded boards with the default engine and with "masked".
+
+Usage: python benchmarks/bench_backends.py [word_count] [board_size] [boards]
+"""
+import os
+import sys
+import tempfile
+
+from _common import synthetic_words, random_board, timed, traced, mib
+from boggle_solver import Boggle, Trie
+from dawg import Dawg
+from packed_trie import PackedTrie
+from sorted_index import SortedIndex
+from trie_snapshot import compile_snapshot, load_snapshot
+
+
+def solve_ms(index, boards, engine):
+    boggle = Boggle([], None, engine=engine)
+    boggle.setIndex(index)
+
+    def solve_all():
+        for board in boards:
+            boggle.setGrid(board)
+            boggle.getSolution()
+    _, seconds = timed(solve_all)
+    return seconds / len(boards) * 1000
+
+
+def main():
+    words = synthetic_words(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    boards = [random_board(n, seed) for seed in range(int(sys.argv[3]) if len(sys.argv) > 3 else 20)]
+    print(f"{len(words)} words, {len(boards)} boards of {n}x{n}")
+    print(f"{'backend':<14}{'build s':>9}{'MiB':>9}{'recursive ms':>14}{'masked ms':>11}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "words.trie")
+        compile_snapshot(words, path)
+        sorted_path = os.path.join(tmpdir, "words.txt")
+        with open(sorted_path, "w") as file:
+            file.write("\n".join(sorted(words)))
+
+        builders = [
+            ("Trie", lambda: Trie.from_words(words)),
+            ("PackedTrie", lambda: PackedTrie.from_words(words)),
+            ("Dawg", lambda: Dawg.from_words(words)),
+            ("SortedIndex", lambda: SortedIndex.from_sorted_file(sorted_path)),
+            ("MappedTrie", lambda: load_snapshot(path)),
+        ]
+        for name, build in builders:
+            _, peak = traced(build)
+            index, seconds = timed(build)
+            print(f"{name:<14}{seconds:9.2f}{mib(peak):9.1f}"
+                  f"{solve_ms(index, boards, 'recursive'):14.1f}"
+                  f"{solve_ms(index, boards, 'masked'):11.1f}")
+            if name == "MappedTrie":
+                index.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+"""
+Measure solve_batch throughput in boards/second
+
+Usage: python benchmarks/bench_batch.py [board_size] [boards] [workers] [word_count]
+"""
+import os
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import solve_batch
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    max_workers = int(sys.argv[3]) if len(sys.argv) > 3 else (os.cpu_count() or 1)
+    words = synthetic_words(int(sys.argv[4]) if len(sys.argv) > 4 else 100000)
+    boards = [random_board(n, seed) for seed in range(count)]
+    print(f"{count} boards of {n}x{n}, {len(words)} words, {os.cpu_count()} CPUs")
+    print(f"{'workers':<10}{'boards/s':>12}{'seconds':>10}")
+    for workers in range(1, max_workers + 1):
+        _, seconds = timed(lambda: list(solve_batch(boards, words, workers=workers,
+                                                    engine="bitmask")))
+        print(f"{workers:<10}{count / seconds:>12.0f}{seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare bulk from_words() index builds against repeated insert() calls
+
+Each build is timed together with a collection of the young generations
+right after it, so collector work a build postpones is charged to it.
+
+Usage: python benchmarks/bench_build.py [word_count]
+"""
+import gc
+import random
+import sys
+
+from _common import synthetic_words, timed
+from boggle_solver import Trie
+from packed_trie import PackedTrie
+
+
+def insert_all(index_class, words):
+    index = index_class()
+    for word in words:
+        index.insert(word)
+    return index
+
+
+def settled(func, *args):
+    result = func(*args)
+    gc.collect(1)
+    return result
+
+
+def main():
+    words = synthetic_words(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
+    random.Random(0).shuffle(words)  # word lists are not always sorted
+    print(f"{len(words)} words, unsorted input")
+    for index_class in (Trie, PackedTrie):
+        _, insert_s = timed(settled, insert_all, index_class, words)
+        _, bulk_s = timed(settled, index_class.from_words, words)
+        print(f"{index_class.__name__:<10} insert() {insert_s:6.2f}s   "
+              f"from_words() {bulk_s:6.2f}s   {insert_s / bulk_s:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
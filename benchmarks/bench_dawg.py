@@ -0,0 +1,41 @@
+"""
+Compare node counts and build cost of Trie against the minimal Dawg
+
+Usage: python benchmarks/bench_dawg.py [word_count] [wordlist_file]
+"""
+import sys
+
+from _common import synthetic_words, timed, traced, mib
+from boggle_solver import Trie, read_words_from_file
+from dawg import Dawg
+
+
+def trie_node_count(trie):
+    count = 0
+    stack = [trie.root]
+    while stack:
+        node = stack.pop()
+        count += 1
+        stack.extend(node.children.values())
+    return count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    if len(sys.argv) > 2:
+        words = [w.lower() for w in read_words_from_file(sys.argv[2])
+                 if w.isalpha() and len(w) >= 3]
+    else:
+        words = synthetic_words(count)
+    trie, trie_s = timed(Trie.from_words, words)
+    dawg, dawg_s = timed(Dawg.from_words, words)
+    _, trie_peak = traced(Trie.from_words, words)
+    _, dawg_peak = traced(Dawg.from_words, words)
+    print(f"{len(words)} words")
+    print(f"{'index':<8}{'nodes':>12}{'build s':>10}{'peak MiB':>14}")
+    print(f"{'Trie':<8}{trie_node_count(trie):>12}{trie_s:>10.2f}{mib(trie_peak):>14.1f}")
+    print(f"{'Dawg':<8}{dawg.node_count():>12}{dawg_s:>10.2f}{mib(dawg_peak):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
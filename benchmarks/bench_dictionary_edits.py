@@ -0,0 +1,48 @@
+"""
+Measure addWords/removeWords against rebuilding with setDictionary
+
+Usage: python benchmarks/bench_dictionary_edits.py [word_count] [edits] [batch]
+"""
+import sys
+
+from _common import synthetic_words, timed
+from boggle_solver import Boggle, Trie, clear_index_cache
+from dawg import Dawg
+from packed_trie import PackedTrie
+from sorted_index import SortedIndex
+
+
+def main():
+    words = synthetic_words(int(sys.argv[1]) if len(sys.argv) > 1 else 300000)
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    batch = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    extra = synthetic_words(edits * batch, seed=1)
+    batches = [extra[i:i + batch] for i in range(0, len(extra), batch)]
+    print(f"{len(words)} words, {edits} edits of {batch} words")
+
+    for index_class in (Trie, PackedTrie, Dawg, SortedIndex):
+        boggle = Boggle([], words, index_class=index_class)
+        _, first_s = timed(boggle.addWords, batches[0])
+
+        def edit():
+            for words_batch in batches:
+                boggle.addWords(words_batch)
+                boggle.removeWords(words_batch)
+        _, edit_s = timed(edit)
+        print(f"{index_class.__name__:<12} first edit (fork of cached index): "
+              f"{first_s * 1000:8.1f}ms  addWords/removeWords per edit: "
+              f"{edit_s / (2 * edits) * 1000:8.1f}ms")
+
+    current = list(words)
+    boggle = Boggle([], words)
+
+    def rebuild():
+        for words_batch in batches[:3]:
+            clear_index_cache()
+            boggle.setDictionary(current + words_batch)
+    _, rebuild_s = timed(rebuild)
+    print(f"Trie         setDictionary per edit: {rebuild_s / 3 * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""
+Compare solve throughput of the Boggle search engines
+
+Usage: python benchmarks/bench_engines.py [board_size] [boards] [word_count]
+"""
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle, ENGINES
+
+
+def solve_all(boggle, boards):
+    for board in boards:
+        boggle.setGrid(board)
+        boggle.getSolution()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    words = synthetic_words(int(sys.argv[3]) if len(sys.argv) > 3 else 100000)
+    boards = [random_board(n, seed) for seed in range(count)]
+    print(f"{count} boards of {n}x{n}, {len(words)} words")
+    print(f"{'engine':<12}{'seconds':>10}{'boards/s':>12}")
+    for engine in ENGINES:
+        boggle = Boggle([], words, engine=engine)
+        _, seconds = timed(solve_all, boggle, boards)
+        print(f"{engine:<12}{seconds:>10.2f}{count / seconds:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
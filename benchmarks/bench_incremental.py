@@ -0,0 +1,50 @@
+"""
+Measure edit-to-result latency of Boggle.updateGrid against a full re-solve
+with each engine
+
+Usage: python benchmarks/bench_incremental.py [board_size] [edits] [word_count]
+"""
+import random
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle, ENGINES
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    edits = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    words = synthetic_words(int(sys.argv[3]) if len(sys.argv) > 3 else 300000)
+    rng = random.Random(0)
+    grid = random_board(n, 0)
+    changes = [(rng.randrange(n), rng.randrange(n), rng.choice("abcdefghijklmnoprstuvwy"))
+               for _ in range(edits)]
+    print(f"{n}x{n} board, {edits} single-tile edits, {len(words)} words")
+
+    boggle = Boggle(grid, words)
+    _, first_s = timed(boggle.updateGrid, [])
+    print(f"first updateGrid (full solve):           {first_s * 1000:8.1f}ms")
+
+    def incremental():
+        for change in changes:
+            boggle.updateGrid([change])
+    _, incremental_s = timed(incremental)
+    print(f"updateGrid per edit:                     {incremental_s / edits * 1000:8.1f}ms")
+
+    # Compare with a full re-solve by every engine, the fastest included
+    for engine in ENGINES:
+        full = Boggle([row[:] for row in grid], words, engine=engine)
+
+        def resolve():
+            for row, col, tile in changes:
+                full.grid[row][col] = tile
+                full.setGrid(full.grid)
+                full.getSolution()
+        _, full_s = timed(resolve)
+        assert full.getSolution() == boggle.getSolution()
+        print(f"{engine:<10} setGrid + getSolution per edit: {full_s / edits * 1000:8.1f}ms"
+              f"  ({full_s / incremental_s:4.1f}x updateGrid)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure what solve instrumentation costs, per engine
+
+Compares getSolution with instrument off (the default, searching the
+index directly) and on (search counters and phase timings, read back
+with getStats), and prints the stats of the last instrumented solve.
+
+Usage: python benchmarks/bench_instrumentation.py [board_size] [word_count]
+"""
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle, ENGINES
+
+
+def best_of(boggle, repeats=5):
+    return min(timed(boggle.getSolution)[1] for _ in range(repeats))
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    words = synthetic_words(int(sys.argv[2]) if len(sys.argv) > 2 else 100000)
+    board = random_board(n)
+    print(f"{n}x{n} board, {len(words)} words")
+
+    for engine in ENGINES:
+        plain = Boggle(board, words, engine=engine)
+        instrumented = Boggle(board, words, engine=engine, instrument=True)
+        assert plain.getSolution() == instrumented.getSolution()
+        off_s = best_of(plain)
+        on_s = best_of(instrumented)
+        stats = instrumented.getStats()
+        print(f"{engine:<10} off {off_s * 1000:8.1f}ms  on {on_s * 1000:8.1f}ms  "
+              f"(+{on_s / off_s - 1:4.0%})  {stats['dfs_calls']:>8} calls  "
+              f"{stats['pruned']:>8} pruned  depth {stats['max_depth']}")
+
+    print("last stats:", stats)
+
+
+if __name__ == "__main__":
+    main()
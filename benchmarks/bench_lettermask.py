@@ -0,0 +1,66 @@
+"""
+Count the recursive calls letter-mask pruning saves on dense boards
+
+Every DFS call steps the index exactly once, so a counting proxy around
+the index gives the number of calls per engine.
+
+Usage: python benchmarks/bench_lettermask.py [board_size] [boards] [word_count]
+"""
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle, Trie
+
+
+class CountingIndex:
+    """Index proxy that counts step() calls"""
+    def __init__(self, index):
+        self.index = index
+        self.root = index.root
+        self.steps = 0
+
+    def __len__(self):
+        return len(self.index)
+
+    def step(self, node, chars):
+        self.steps += 1
+        return self.index.step(node, chars)
+
+    def is_word(self, node):
+        return self.index.is_word(node)
+
+    def child_mask(self, node):
+        return self.index.child_mask(node)
+
+    def search(self, word):
+        return self.index.search(word)
+
+    def starts_with(self, prefix):
+        return self.index.starts_with(prefix)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 6
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    words = synthetic_words(int(sys.argv[3]) if len(sys.argv) > 3 else 100000)
+    boards = [random_board(n, seed) for seed in range(count)]
+    trie = Trie.from_words(words)
+    print(f"{count} boards of {n}x{n}, {len(words)} words")
+    print(f"{'engine':<10}{'calls/board':>14}{'ms/board':>10}")
+    for engine in ("bitmask", "masked"):
+        counting = CountingIndex(trie)
+        boggle = Boggle([], None, engine=engine)
+        boggle.setIndex(counting)
+        for board in boards:
+            boggle.setGrid(board)
+            boggle.getSolution()
+        steps = counting.steps
+
+        boggle.setIndex(trie)
+        _, seconds = timed(lambda: [boggle.setGrid(b) or boggle.getSolution()
+                                    for b in boards])
+        print(f"{engine:<10}{steps / count:>14.0f}{seconds / count * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare peak RSS of loading a word list eagerly against streaming it
+
+Each loader runs in a fresh process so its peak RSS is measured alone.
+
+Usage: python benchmarks/bench_loader.py [word_count] [copies]
+"""
+import gzip
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+from _common import synthetic_words, timed, mib
+from boggle_solver import Boggle, iter_dictionary, read_words_from_file
+
+LOADERS = {
+    "none": lambda path: None,
+    "read_words_from_file": lambda path: Boggle([], read_words_from_file(path)),
+    "iter_dictionary": lambda path: Boggle([], iter_dictionary(path)),
+}
+
+
+def peak_rss():
+    """Peak resident set size of this process in bytes"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def child(loader, path):
+    boggle, seconds = timed(LOADERS[loader], path)
+    words = len(boggle.trie) if boggle is not None else 0
+    print(f"{loader:<22} {os.path.basename(path):<14} {seconds:7.2f}s "
+          f"{mib(peak_rss()):8.1f} MiB peak RSS  {words} words")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    copies = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    words = synthetic_words(count)
+    # Repeat the list in mixed case, as corpus-derived lists tend to be
+    text = "\n".join(words + [word.upper() for word in words] * (copies - 1)) + "\n"
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = os.path.join(tmpdir, "words.txt")
+        packed = os.path.join(tmpdir, "words.txt.gz")
+        with open(plain, "w") as file:
+            file.write(text)
+        with gzip.open(packed, "wt") as file:
+            file.write(text)
+        print(f"{count * copies} words ({count} distinct), "
+              f"{mib(os.path.getsize(plain)):.1f} MiB plain, "
+              f"{mib(os.path.getsize(packed)):.1f} MiB gzip")
+        for path in (plain, packed):
+            for loader in LOADERS:
+                subprocess.run([sys.executable, __file__, "--child", loader, path],
+                               check=True)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3])
+    else:
+        main()
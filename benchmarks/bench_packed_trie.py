@@ -0,0 +1,32 @@
+"""
+Compare construction time and memory of Trie against PackedTrie
+
+Usage: python benchmarks/bench_packed_trie.py [word_count]
+"""
+import sys
+
+from _common import synthetic_words, timed, traced, mib
+from boggle_solver import Trie
+from packed_trie import PackedTrie
+
+
+def build(index_class, words):
+    index = index_class()
+    for word in words:
+        index.insert(word)
+    return index
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    words = synthetic_words(count)
+    print(f"{count} words, {sum(map(len, words))} characters")
+    print(f"{'index':<12}{'build s':>10}{'peak MiB':>12}")
+    for index_class in (Trie, PackedTrie):
+        _, seconds = timed(build, index_class, words)
+        _, peak = traced(build, index_class, words)
+        print(f"{index_class.__name__:<12}{seconds:>10.2f}{mib(peak):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+"""
+Report getSolution scaling from 1 to N worker processes on large boards
+
+Usage: python benchmarks/bench_parallel.py [board_size] [max_workers] [word_count]
+"""
+import os
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 15
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    words = synthetic_words(int(sys.argv[3]) if len(sys.argv) > 3 else 100000)
+    board = random_board(n, seed=1)
+    print(f"{n}x{n} board, {len(words)} words, {os.cpu_count()} CPUs")
+    print(f"{'workers':<10}{'seconds':>10}{'speedup':>10}")
+    baseline = None
+    for workers in range(1, max_workers + 1):
+        boggle = Boggle(board, words, engine="bitmask", workers=workers)
+        _, seconds = timed(boggle.getSolution)
+        baseline = baseline or seconds
+        print(f"{workers:<10}{seconds:>10.2f}{baseline / seconds:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Measure per-board dictionary pre-filtering on small boards
+
+Usage: python benchmarks/bench_prefilter.py [board_size] [boards] [word_count]
+"""
+import sys
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle, filter_words
+import board_filter
+from board_filter import WordFilter
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    words = synthetic_words(int(sys.argv[3]) if len(sys.argv) > 3 else 300000)
+    boards = [random_board(n, seed) for seed in range(count)]
+    print(f"{count} boards of {n}x{n}, {len(words)} words, "
+          f"NumPy {'available' if board_filter.np is not None else 'missing'}")
+
+    word_filter, build_s = timed(WordFilter, filter_words(words))
+    kept, filter_s = timed(lambda: [len(word_filter.feasible(b)) for b in boards])
+    print(f"filter tables built once in {build_s:.2f}s; "
+          f"{filter_s / count * 1000:.1f}ms per board, "
+          f"{sum(kept) / count:.0f} of {len(words)} words kept on average")
+
+    for prefilter in (False, True):
+        boggle = Boggle([], words, engine="bitmask", prefilter=prefilter)
+        boggle._search_index(boggle.grid, boggle.trie)  # build the filter tables outside the timing
+
+        def solve_all():
+            for board in boards:
+                boggle.setGrid(board)
+                boggle.getSolution()
+        _, seconds = timed(solve_all)
+        print(f"prefilter={prefilter!s:<6} {seconds / count * 1000:8.1f}ms per board")
+
+
+if __name__ == "__main__":
+    main()
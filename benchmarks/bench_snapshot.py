@@ -0,0 +1,31 @@
+"""
+Compare cold-start cost of building an index against mapping a snapshot
+
+Usage: python benchmarks/bench_snapshot.py [word_count]
+"""
+import os
+import sys
+import tempfile
+
+from _common import synthetic_words, timed
+from boggle_solver import Boggle
+from trie_snapshot import compile_snapshot, load_snapshot
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 300000
+    words = synthetic_words(count)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "words.trie")
+        _, compile_s = timed(compile_snapshot, words, path)
+        _, build_s = timed(Boggle, [], words)
+        mapped, load_s = timed(load_snapshot, path)
+        print(f"{count} words, snapshot {os.path.getsize(path) / 1e6:.1f} MB")
+        print(f"compile snapshot (once): {compile_s:.3f}s")
+        print(f"Boggle(grid, words):     {build_s:.3f}s")
+        print(f"load_snapshot(path):     {load_s * 1000:.3f}ms")
+        mapped.close()
+
+
+if __name__ == "__main__":
+    main()
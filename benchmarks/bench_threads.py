@@ -0,0 +1,44 @@
+"""
+Measure thread-pool solving: start cells split across threads, and many
+threads sharing one solver
+
+Threads only speed solving up on free-threaded Python builds; under the
+GIL the results stay correct but the wall time does not drop.
+
+Usage: python benchmarks/bench_threads.py [board_size] [word_count]
+"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from _common import synthetic_words, random_board, timed
+from boggle_solver import Boggle
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 12
+    words = synthetic_words(int(sys.argv[2]) if len(sys.argv) > 2 else 300000)
+    board = random_board(n)
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{n}x{n} board, {len(words)} words, {os.cpu_count()} CPUs, "
+          f"GIL {'enabled' if gil else 'disabled'}")
+
+    expected, serial_s = timed(Boggle(board, words, engine="masked").getSolution)
+    print(f"serial:              {serial_s * 1000:8.1f}ms")
+    for threads in (2, 4, 8):
+        boggle = Boggle(board, words, engine="masked", workers=threads, pool="thread")
+        result, seconds = timed(boggle.getSolution)
+        assert result == expected
+        print(f"pool=thread x{threads}:     {seconds * 1000:8.1f}ms  "
+              f"{serial_s / seconds:4.2f}x")
+
+    shared = Boggle(board, words, engine="masked")
+    with ThreadPoolExecutor(8) as executor:
+        results, seconds = timed(lambda: list(executor.map(
+            lambda _: shared.getSolution(), range(16))))
+    assert all(result == expected for result in results)
+    print(f"16 solves, 8 threads, one shared solver: {seconds / 16 * 1000:8.1f}ms per solve")
+
+
+if __name__ == "__main__":
+    main()
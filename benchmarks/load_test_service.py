@@ -0,0 +1,79 @@
+"""
+Open-loop load test of SolveService: requests arrive at a fixed rate
+whether or not earlier ones finished, like clients of a web app
+
+Usage: python benchmarks/load_test_service.py [rps] [seconds] [board_size]
+           [distinct_boards] [executor] [word_count]
+"""
+import asyncio
+import os
+import random
+import sys
+import time
+
+from _common import synthetic_words, random_board, timed
+from solve_service import ServiceBusy, SolveService
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(service, rps, seconds, boards):
+    rng = random.Random(0)
+    latencies = []
+    busy = 0
+
+    async def request(board):
+        nonlocal busy
+        start = time.perf_counter()
+        try:
+            await service.solve(board)
+        except ServiceBusy:
+            busy += 1
+            return
+        latencies.append(time.perf_counter() - start)
+
+    requests = []
+    start = time.perf_counter()
+    for i in range(int(rps * seconds)):
+        delay = start + i / rps - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        requests.append(asyncio.ensure_future(request(rng.choice(boards))))
+    await asyncio.gather(*requests)
+    return latencies, busy, time.perf_counter() - start
+
+
+def main():
+    rps = float(sys.argv[1]) if len(sys.argv) > 1 else 50
+    seconds = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    n = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    distinct = int(sys.argv[4]) if len(sys.argv) > 4 else 200
+    executor = sys.argv[5] if len(sys.argv) > 5 else "thread"
+    words = synthetic_words(int(sys.argv[6]) if len(sys.argv) > 6 else 300000)
+    boards = [random_board(n, seed) for seed in range(distinct)]
+    workers = os.cpu_count() or 1
+
+    service, warm_s = timed(SolveService, words, max_concurrency=workers,
+                            executor=executor, freeze_index=True, engine="masked")
+    print(f"{executor} executor, {workers} workers, index warmed in {warm_s:.2f}s")
+    print(f"target {rps:.0f} req/s for {seconds:.0f}s, {n}x{n} boards, "
+          f"{distinct} distinct")
+    latencies, busy, elapsed = asyncio.run(run(service, rps, seconds, boards))
+    service.close()
+
+    print(f"completed {len(latencies)} in {elapsed:.1f}s "
+          f"({len(latencies) / elapsed:.1f} req/s), {busy} rejected as busy")
+    if latencies:
+        print(f"latency p50 {percentile(latencies, 0.50) * 1000:.1f}ms  "
+              f"p99 {percentile(latencies, 0.99) * 1000:.1f}ms  "
+              f"max {max(latencies) * 1000:.1f}ms")
+    print(f"computations {service.solves}, coalesced {service.coalesced}, "
+          f"dropped {service.dropped}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""
+Per-board dictionary pre-filtering
+
+Before searching a board, words that can never be formed on it are
+dropped in bulk: words needing more of a letter than the board's tiles
+provide, and words containing a letter pair that neither occurs inside a
+tile nor across two adjacent tiles. Both tests only reject impossible
+words, so searching the survivors gives the same solution.
+
+NumPy is used when installed; otherwise the same tests run in Python.
+"""
+from collections import Counter
+
+from boggle_solver import neighbor_table
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def board_letters(grid):
+    """Returns a Counter of every letter on the board's tiles"""
+    return Counter(char for row in grid for tile in row for char in tile)
+
+
+def board_bigrams(grid):
+    """
+    Returns the letter pairs a path across the board can produce
+
+    Pairs come from inside multi-letter tiles ("qu" gives "qu") and from
+    the last letter of a tile followed by the first letter of any adjacent
+    tile. Returns None when the board has an empty tile, since a path can
+    step through it and join letters from non-adjacent tiles.
+
+    Args:
+        grid: NxN 2D array of lowercase strings
+
+    Returns:
+        Set of two-character strings, or None if any pair is possible
+    """
+    cells = [tile for row in grid for tile in row]
+    if not all(cells):
+        return None
+    pairs = set()
+    for cell, neighbors in enumerate(neighbor_table(len(grid))):
+        tile = cells[cell]
+        for i in range(len(tile) - 1):
+            pairs.add(tile[i:i + 2])
+        for neighbor in neighbors:
+            pairs.add(tile[-1] + cells[neighbor][0])
+    return pairs
+
+
+class WordFilter:
+    """
+    Rejects dictionary words that a given board cannot form
+
+    Built once per word list; the NumPy tables (letter masks and counts
+    per word, and each word's letter pairs) are reused for every board.
+    """
+    def __init__(self, words, use_numpy=None):
+        """
+        Args:
+            words: filtered word list (see boggle_solver.filter_words)
+            use_numpy: force the NumPy (True) or pure Python (False) path;
+                default uses NumPy when it is installed
+        """
+        self.words = list(words)
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        if self.use_numpy and np is None:
+            raise ValueError("use_numpy=True requires NumPy")
+        # An empty list has nothing to tabulate; feasible() returns early
+        if self.use_numpy and self.words:
+            self._build_tables()
+
+    def _build_tables(self):
+        lengths = np.fromiter((len(word) for word in self.words), dtype=np.int64,
+                              count=len(self.words))
+        text = "".join(self.words).encode("utf-32-le")
+        codes = np.frombuffer(text, dtype=np.uint32)
+        alphabet, letters = np.unique(codes, return_inverse=True)
+        letters = letters.reshape(-1).astype(np.int64)
+        size = len(alphabet)
+        owner = np.repeat(np.arange(len(self.words)), lengths)
+
+        # Letter counts per word (rows) and letter (columns)
+        counts = np.zeros((len(self.words), size), dtype=np.uint8)
+        np.add.at(counts, (owner, letters), 1)
+
+        # Letter-presence bitmask per word for a cheap first pass
+        masks = None
+        if size <= 64:
+            masks = np.zeros(len(self.words), dtype=np.uint64)
+            np.bitwise_or.at(masks, owner, np.left_shift(np.uint64(1),
+                                                         letters.astype(np.uint64)))
+
+        # Letter pair ids per word, padded with an always-allowed id
+        width = max(int(lengths.max()) - 1, 1)
+        pad = size * size
+        pair_dtype = np.int16 if pad < np.iinfo(np.int16).max else np.int32
+        pairs = np.full((len(self.words), width), pad, dtype=pair_dtype)
+        same_word = owner[:-1] == owner[1:]
+        starts = np.cumsum(lengths) - lengths
+        position = np.arange(len(letters)) - starts[owner]
+        pairs[owner[:-1][same_word], position[:-1][same_word]] = \
+            (letters[:-1] * size + letters[1:])[same_word]
+
+        self._alphabet = {chr(code): i for i, code in enumerate(alphabet.tolist())}
+        self._lengths = lengths
+        self._counts = counts
+        self._masks = masks
+        self._pairs = pairs
+
+    def feasible(self, grid):
+        """
+        Returns the words that pass the letter and letter-pair tests
+
+        Args:
+            grid: NxN 2D array of lowercase strings
+
+        Returns:
+            List of words, in dictionary order
+        """
+        if not self.words:
+            return []
+        letters = board_letters(grid)
+        bigrams = board_bigrams(grid)
+        if self.use_numpy:
+            return self._feasible_numpy(letters, bigrams)
+        return self._feasible_python(letters, bigrams)
+
+    def _feasible_numpy(self, letters, bigrams):
+        alphabet = self._alphabet
+        size = len(alphabet)
+        inventory = np.zeros(size, dtype=np.uint8)
+        for char, count in letters.items():
+            if char in alphabet:
+                inventory[alphabet[char]] = min(count, 255)
+
+        # Cheap passes over every word narrow the candidates first
+        ok = self._lengths <= sum(letters.values())
+        if self._masks is not None:
+            board_mask = np.uint64(0)
+            for i in np.flatnonzero(inventory).tolist():
+                board_mask |= np.uint64(1 << i)
+            ok &= (self._masks & ~board_mask) == 0
+        candidates = np.flatnonzero(ok)
+
+        # Exact letter counts and letter pairs for the survivors only
+        ok = (self._counts[candidates] <= inventory).all(axis=1)
+        if bigrams is not None:
+            allowed = np.zeros(size * size + 1, dtype=bool)
+            allowed[size * size] = True
+            for pair in bigrams:
+                if pair[0] in alphabet and pair[1] in alphabet:
+                    allowed[alphabet[pair[0]] * size + alphabet[pair[1]]] = True
+            ok &= allowed[self._pairs[candidates]].all(axis=1)
+        words = self.words
+        return [words[i] for i in candidates[ok].tolist()]
+
+    def _feasible_python(self, letters, bigrams):
+        available = set(letters)
+        total = sum(letters.values())
+        result = []
+        for word in self.words:
+            if len(word) > total or not available.issuperset(word):
+                continue
+            if any(word.count(char) > letters[char] for char in set(word)):
+                continue
+            if bigrams is not None and any(word[i:i + 2] not in bigrams
+                                           for i in range(len(word) - 1)):
+                continue
+            result.append(word)
+        return result
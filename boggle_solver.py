@@ -1,16 +1,650 @@
+import argparse
+import bz2
+import contextlib
+import gc
+import gzip
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+
+def open_word_file(filename):
+    """
+    Opens a word list for reading as text, decompressing it if needed
+
+    gzip and bz2 files are recognized by their leading magic bytes, so
+    the file name does not need a .gz/.bz2 extension.
+
+    Args:
+        filename: The path to the file to open
+
+    Returns:
+        A text file object
+    """
+    with open(filename, 'rb') as file:
+        magic = file.read(3)
+    if magic[:2] == b"\x1f\x8b":
+        return gzip.open(filename, 'rt')
+    if magic == b"BZh":
+        return bz2.open(filename, 'rt')
+    return open(filename, 'r')
+
+
+def iter_words_from_file(filename, chunk_size=1 << 16):
+    """
+    Yields the whitespace-separated words of a file one at a time
+
+    The file is read in chunks of chunk_size characters, so memory use
+    does not depend on the file size or its line lengths.
+
+    Args:
+        filename: The path to the file to read (plain, gzip or bz2)
+        chunk_size: characters read per chunk
+
+    Yields:
+        Each word in file order
+    """
+    with open_word_file(filename) as file:
+        tail = ""
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            words = (tail + chunk).split()
+            # A word cut off at the end of the chunk continues in the next
+            tail = words.pop() if words and not chunk[-1].isspace() else ""
+            yield from words
+        if tail:
+            yield tail
+
+
 def read_words_from_file(filename):
     """
     Opens a file and reads the contents as a list of words.
 
     Args:
-        filename: The path to the file to read
+        filename: The path to the file to read (plain, gzip or bz2)
 
     Returns:
         A list of words from the file
     """
-    with open(filename, 'r') as file:
-        words = file.read().split()
-    return words
+    return list(iter_words_from_file(filename))
+
+
+def iter_dictionary(filename):
+    """
+    Streams a word list file as the words Boggle would keep
+
+    Words are normalized and filtered like filter_words and duplicates
+    are dropped, without building the raw word list in memory; pass the
+    result straight to Boggle or setDictionary.
+
+    Args:
+        filename: The path to the file to read (plain, gzip or bz2)
+
+    Yields:
+        Each distinct lowercase, alphabetic word of at least 3 characters
+    """
+    seen = set()
+    for word in iter_words_from_file(filename):
+        if word.isalpha() and len(word) >= 3:
+            word = word.lower()
+            if word not in seen:
+                seen.add(word)
+                yield word
+
+
+def filter_words(dictionary):
+    """
+    Normalizes a word list the way Boggle stores its dictionary
+
+    Args:
+        dictionary: iterable of words (None or empty gives an empty list)
+
+    Returns:
+        List of lowercase words that are alphabetic and at least 3 characters
+    """
+    if not dictionary:
+        return []
+    return [
+        word.lower() for word in dictionary
+        if isinstance(word, str) and word.isalpha() and len(word) >= 3
+    ]
+
+
+# Search engines accepted by Boggle(engine=...)
+ENGINES = ("recursive", "bitmask", "masked", "pruned", "iterative")
+
+# Worker pools accepted by Boggle(pool=...) for workers > 1
+POOLS = ("process", "thread")
+
+# Phases the wall time of an instrumented getSolution is split over
+SOLVE_PHASES = ("normalize", "filter", "build", "search", "sort")
+
+# Methods every dictionary index provides, next to a root node attribute
+# and a from_words() classmethod; see Trie. Indexes may add child_mask(),
+# max_remaining()/height() and word_count()/children() with
+# tree_shaped = True, which the faster engines use when present, and
+# fork() with insert()/remove(), which Boggle.addWords/removeWords use to
+# edit a private copy instead of rebuilding.
+INDEX_METHODS = ("step", "is_word", "search", "starts_with", "__len__")
+
+
+def check_index(index):
+    """
+    Raises TypeError unless index provides the dictionary index methods
+
+    Args:
+        index: index object, or index class (then from_words is required
+            and the root attribute is not checked)
+    """
+    required = INDEX_METHODS + (("from_words",) if isinstance(index, type) else ())
+    missing = [name for name in required if not callable(getattr(index, name, None))]
+    if not isinstance(index, type) and not hasattr(index, "root"):
+        missing.append("root")
+    if missing:
+        name = index.__name__ if isinstance(index, type) else type(index).__name__
+        raise TypeError(f"{name} is not a dictionary index, missing {', '.join(missing)}")
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+# Process-wide LRU of built dictionary indexes, keyed by dictionary_key()
+_index_cache = OrderedDict()
+_index_cache_lock = threading.Lock()
+_index_cache_stats = {"hits": 0, "misses": 0, "maxsize": 8}
+
+
+def dictionary_key(words, index_class):
+    """
+    Returns a key identifying an index built from words
+
+    The index class is part of the key as an object, not by name, so
+    distinct classes that share a name (local classes, reloaded modules)
+    never share an index. The words are hashed a slice at a time instead
+    of joining the whole list into one string.
+
+    Args:
+        words: filtered word list, as produced by filter_words
+        index_class: class the index is built with
+
+    Returns:
+        (index_class, hex digest) tuple that is equal for equal word lists
+        and index classes
+    """
+    digest = hashlib.sha256()
+    for start in range(0, len(words), 4096):
+        digest.update("\n".join(words[start:start + 4096]).encode())
+        digest.update(b"\n")
+    return index_class, digest.hexdigest()
+
+
+# Keys for prebuilt indexes passed to Boggle.setIndex, by index object
+_prebuilt_keys = weakref.WeakKeyDictionary()
+_prebuilt_counter = itertools.count()
+
+
+def prebuilt_index_key(index):
+    """Returns a key that identifies a prebuilt index object for its lifetime"""
+    with _index_cache_lock:
+        key = _prebuilt_keys.get(index)
+        if key is None:
+            key = _prebuilt_keys[index] = f"prebuilt-{next(_prebuilt_counter)}"
+        return key
+
+
+def cached_index(words, index_class, key=None):
+    """
+    Returns the shared index for words, building it on a cache miss
+
+    Cached indexes are shared between Boggle instances and must not be
+    mutated in place.
+
+    Args:
+        words: filtered word list
+        index_class: class providing from_words()
+        key: dictionary_key(words, index_class), computed if omitted
+
+    Returns:
+        Index containing words
+    """
+    key = key or dictionary_key(words, index_class)
+    with _index_cache_lock:
+        index = _index_cache.get(key)
+        if index is not None:
+            _index_cache.move_to_end(key)
+            _index_cache_stats["hits"] += 1
+            return index
+        _index_cache_stats["misses"] += 1
+
+    index = index_class.from_words(words)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > _index_cache_stats["maxsize"]:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def index_cache_info():
+    """Returns hit/miss counters and size of the shared index cache"""
+    with _index_cache_lock:
+        return CacheInfo(_index_cache_stats["hits"], _index_cache_stats["misses"],
+                         _index_cache_stats["maxsize"], len(_index_cache))
+
+
+def clear_index_cache(maxsize=None):
+    """
+    Empties the shared index cache and resets its counters
+
+    Args:
+        maxsize: optional new capacity (0 disables caching)
+    """
+    with _index_cache_lock:
+        _index_cache.clear()
+        _index_cache_stats["hits"] = _index_cache_stats["misses"] = 0
+        if maxsize is not None:
+            _index_cache_stats["maxsize"] = maxsize
+
+
+def canonical_grid(grid):
+    """
+    Returns the canonical form of a square grid under its 8 symmetries
+
+    Rotations and reflections keep every adjacency, so all 8 dihedral
+    transforms of a board have the same solution. The canonical form is
+    the smallest of them as a tuple of row tuples.
+
+    Args:
+        grid: NxN 2D array of strings
+
+    Returns:
+        Tuple of tuples, equal for boards that are rotations/reflections
+    """
+    rows = tuple(tuple(row) for row in grid)
+    forms = []
+    for _ in range(4):
+        rows = tuple(zip(*rows[::-1]))  # rotate 90 degrees clockwise
+        forms.append(rows)
+        forms.append(tuple(zip(*rows)))  # and its transpose
+    return min(forms)
+
+
+class SolutionCache:
+    """
+    Bounded LRU of solutions keyed by dictionary and canonical board
+
+    Pass one to Boggle(solution_cache=...) to share it between solvers;
+    repeated boards, including rotated and reflected ones, are answered
+    without searching.
+    """
+    def __init__(self, capacity=1024):
+        if capacity < 0:
+            raise ValueError("capacity must be >= 0")
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the cached solution tuple for key, or None"""
+        with self._lock:
+            words = self._entries.get(key)
+            if words is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return words
+
+    def put(self, key, words):
+        """Stores a solution for key, evicting the least recently used"""
+        with self._lock:
+            self._entries[key] = tuple(words)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.capacity:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops every entry and resets the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def hit_rate(self):
+        """Returns the fraction of lookups answered from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def info(self):
+        """Returns hit/miss counters and size like index_cache_info()"""
+        return CacheInfo(self.hits, self.misses, self.capacity, len(self._entries))
+
+    def carry_over(self, old_key, new_key, update):
+        """
+        Copies the solutions of one dictionary over to an edited dictionary
+
+        Entries of other dictionaries, and the old entries themselves, are
+        left alone: solvers still using the old dictionary keep them.
+
+        Args:
+            old_key: dictionary_key of the dictionary before the edit
+            new_key: dictionary_key of the dictionary after the edit
+            update: called as update(grid, bounds, words) for each old
+                entry; returns the solution under the new dictionary, or
+                None if it is no longer known (the entry is dropped)
+        """
+        with self._lock:
+            entries = [(key, words) for key, words in self._entries.items()
+                       if key[0] == old_key]
+        for (_, grid, bounds), words in entries:
+            words = update(grid, bounds, words)
+            if words is not None:
+                self.put((new_key, grid, bounds), words)
+
+
+# Boggle instance (and the index it searches) installed in each worker
+# process by _init_worker
+_worker_boggle = None
+_worker_index = None
+_worker_bounds = None
+_worker_grid = None
+
+
+def _init_worker(boggle, index=None, bounds=None, grid=None):
+    """Pool initializer: keep the solver and its index for every task"""
+    global _worker_boggle, _worker_index, _worker_bounds, _worker_grid
+    _worker_boggle = boggle
+    _worker_index = index if index is not None else boggle.trie
+    _worker_bounds = bounds or word_bounds()
+    _worker_grid = grid if grid is not None else boggle.grid
+
+
+def _pool_context():
+    """Multiprocessing context that lets workers inherit state by fork"""
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("fork" if "fork" in methods else None)
+
+
+def _solve_grid(grid):
+    """Pool task: solve one board with this worker's solver"""
+    boggle = _worker_boggle
+    boggle.setGrid(grid)
+    return boggle.getSolution()
+
+
+def _solve_grid_timed(grid):
+    """Pool task: solve one board, returning (solution, seconds)"""
+    start = time.perf_counter()
+    solution = _solve_grid(grid)
+    return solution, time.perf_counter() - start
+
+
+def _solve_chunk(grids, timings=False):
+    """Pool task: solve a chunk of boards in order, timing each if asked"""
+    task = _solve_grid_timed if timings else _solve_grid
+    return [task(grid) for grid in grids]
+
+
+def _solve_cells(starts):
+    """
+    Pool task: search from the given start cells in this worker
+
+    Returns the found words, paired with this task's search counters when
+    the solve is instrumented
+    """
+    boggle = _worker_boggle
+    solution = set()
+    index = _worker_index
+    if isinstance(index, _CountingIndex):
+        index = _CountingIndex(index.index)
+        boggle._search(_worker_grid, starts, index, _worker_bounds, solution)
+        return solution, index.counts()
+    boggle._search(_worker_grid, starts, index, _worker_bounds, solution)
+    return solution
+
+
+def _trace_word(cells, neighbors, word, within):
+    """
+    Finds a path spelling word that uses only the given cells
+
+    Args:
+        cells: flattened grid tiles
+        neighbors: neighbor_table() of the grid
+        word: word to spell
+        within: bitmask of the cells the path may use
+
+    Returns:
+        Bitmask of the path found, or 0 if there is none
+    """
+    def trace(cell, rest, path):
+        tile = cells[cell]
+        if not rest.startswith(tile):
+            return 0
+        rest = rest[len(tile):]
+        path |= 1 << cell
+        if not rest:
+            return path
+        for neighbor in neighbors[cell]:
+            if within >> neighbor & 1 and not path >> neighbor & 1:
+                found = trace(neighbor, rest, path)
+                if found:
+                    return found
+        return 0
+
+    for cell in range(len(cells)):
+        if within >> cell & 1:
+            found = trace(cell, word, 0)
+            if found:
+                return found
+    return 0
+
+
+# Neighbor index tables for NxN grids, cached by N
+_neighbor_tables = {}
+
+
+def neighbor_table(n):
+    """
+    Returns the 8-way neighbors of every cell of an NxN grid
+
+    Cells are numbered row by row (index = row * n + col). Tables are
+    built once per size and shared by every solve.
+
+    Args:
+        n: grid size
+
+    Returns:
+        Tuple where entry i is a tuple of the cell indexes adjacent to cell i
+    """
+    table = _neighbor_tables.get(n)
+    if table is None:
+        table = tuple(
+            tuple(r * n + c
+                  for r in range(row - 1, row + 2)
+                  for c in range(col - 1, col + 2)
+                  if 0 <= r < n and 0 <= c < n and (r, c) != (row, col))
+            for row in range(n) for col in range(n)
+        )
+        _neighbor_tables[n] = table
+    return table
+
+
+def letter_bit(char):
+    """
+    Returns the bit standing for char in child and neighbor letter masks
+
+    Letters a-z get distinct bits; other characters may share a bit, which
+    only makes masks less selective, never wrong.
+    """
+    return 1 << (ord(char) & 63)
+
+
+def word_bounds(min_word_length=None, max_word_length=None):
+    """
+    Normalizes caller word-length limits into the (lo, hi) searched
+
+    Args:
+        min_word_length: shortest word to report (never below 3)
+        max_word_length: longest word to report, or None for no limit
+
+    Returns:
+        Tuple (lo, hi) of inclusive word lengths
+    """
+    lo = max(3, min_word_length or 3)
+    hi = sys.maxsize if max_word_length is None else max_word_length
+    return lo, hi
+
+
+def _charge(seconds, phase, start):
+    """
+    Adds the time since start to seconds[phase], for instrumented solves
+
+    Returns the current time, to start the next phase from.
+    """
+    now = time.perf_counter()
+    seconds[phase] = seconds.get(phase, 0.0) + now - start
+    return now
+
+
+def _remaining_pruner(index, bounds):
+    """
+    Returns index.max_remaining when a minimum length can prune the search
+
+    Every node lies on some word of at least 3 letters, so the check only
+    helps for minimums above 3. Returns None when it cannot prune.
+    """
+    if bounds[0] <= 3:
+        return None
+    return getattr(index, "max_remaining", None)
+
+
+@contextlib.contextmanager
+def gc_paused():
+    """
+    Suspends cyclic garbage collection for the duration of a with block
+
+    Building an index allocates millions of nodes that all stay alive;
+    without this the collector rescans every one of them again and
+    again while they are created. Pausing only postpones part of that
+    work: the new objects would all be scanned by the next young
+    collection, a stall of seconds at some unrelated later allocation.
+    So the young generations are collected once before collection is
+    re-enabled, moving the survivors to the oldest generation while the
+    caller is still building. This scans only objects made since the
+    last collection, so small builds stay cheap.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.collect(1)
+            gc.enable()
+
+
+class _CountingIndex:
+    """
+    Index wrapper counting what a search does, for instrumented solves
+
+    Nodes are wrapped as (node, depth) pairs, depth being the characters
+    consumed from the root, and every optional method of the wrapped index
+    is passed through, so each engine runs unchanged on top of it. Only
+    instrumented solves pay for the wrapper; others search the index
+    directly.
+    """
+    def __init__(self, index):
+        self.index = index
+        self.root = (index.root, 0)
+        self.tree_shaped = getattr(index, "tree_shaped", False)
+        for name in ("child_mask", "max_remaining", "word_count"):
+            method = getattr(index, name, None)
+            if method is not None:
+                setattr(self, name, self._unwrapped(method))
+        if hasattr(index, "children"):
+            self.children = self._children
+        self.calls = 0      # step() calls: one per tile a prefix was extended with
+        self.pruned = 0     # steps whose prefix is in no word
+        self.visits = 0     # index nodes entered
+        self.max_depth = 0  # longest prefix reached, in characters
+
+    @staticmethod
+    def _unwrapped(method):
+        return lambda node: method(node[0])
+
+    def __len__(self):
+        return len(self.index)
+
+    def step(self, node, chars):
+        """Follow chars from a wrapped node, counting the step"""
+        self.calls += 1
+        node, depth = node
+        node = self.index.step(node, chars)
+        if node is None:
+            self.pruned += 1
+            return None
+        depth += len(chars)
+        self.visits += len(chars)
+        if depth > self.max_depth:
+            self.max_depth = depth
+        return node, depth
+
+    def uncounted_step(self, node, chars):
+        """Like step(), for bookkeeping walks that are not part of the search"""
+        node, depth = node
+        node = self.index.step(node, chars)
+        return None if node is None else (node, depth + len(chars))
+
+    def is_word(self, node):
+        return self.index.is_word(node[0])
+
+    def _children(self, node):
+        node, depth = node
+        for char, child in self.index.children(node):
+            yield char, (child, depth + 1)
+
+    def search(self, word):
+        return self.index.search(word)
+
+    def starts_with(self, prefix):
+        return self.index.starts_with(prefix)
+
+    def counts(self):
+        """Returns (calls, pruned, visits, max_depth)"""
+        return self.calls, self.pruned, self.visits, self.max_depth
+
+    def add_counts(self, counts):
+        """Merges counts() of a search run elsewhere into this one"""
+        calls, pruned, visits, max_depth = counts
+        self.calls += calls
+        self.pruned += pruned
+        self.visits += visits
+        self.max_depth = max(self.max_depth, max_depth)
+
+
+class _BudgetExhausted(Exception):
+    """Raised inside a streaming search when its time budget runs out"""
 
 
 class TrieNode:
@@ -18,21 +652,165 @@ class TrieNode:
     def __init__(self):
         self.children = {}  # Maps characters to TrieNode
         self.is_word = False  # True if this node represents end of a word
+        self.mask = 0  # letter_bit() of every child edge, OR-ed together
+        self.longest = 0  # Length of the longest word suffix below this node
+        self.count = 0  # Number of words ending at or below this node
+
+    def copy(self):
+        """Return a node with the same fields and its own children dict"""
+        node = TrieNode()
+        node.children = dict(self.children)
+        node.is_word = self.is_word
+        node.mask = self.mask
+        node.longest = self.longest
+        node.count = self.count
+        return node
 
 
 class Trie:
     """Trie (prefix tree) for efficient word and prefix lookup"""
+    # Every node is reached by exactly one prefix, so per-solve state can
+    # be keyed by node (see Boggle engine "pruned")
+    tree_shaped = True
+
     def __init__(self):
         self.root = TrieNode()
+        self.size = 0  # Number of distinct words stored
+        self._owned = None  # ids of the nodes edits may change, None for all
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Build a trie containing every word in words in one pass
+
+        Words are sorted and deduplicated first, so each word shares its
+        longest common prefix with the previous one and only the nodes
+        after that prefix are new. The path of the previous word is kept
+        on a stack; a node leaving it is complete, and its count and
+        height are added to its parent there instead of per word.
+        Garbage collection is paused while the nodes are created.
+
+        Args:
+            words: iterable of words
+
+        Returns:
+            A Trie containing every word
+        """
+        trie = cls()
+        path = [trie.root]
+        previous = ""
+
+        def close(depth):
+            while len(path) > depth + 1:
+                node = path.pop()
+                parent = path[-1]
+                parent.count += node.count
+                if parent.longest < node.longest + 1:
+                    parent.longest = node.longest + 1
+
+        with gc_paused():
+            for word in sorted(set(words)):
+                common = 0
+                for a, b in zip(word, previous):
+                    if a != b:
+                        break
+                    common += 1
+                close(common)
+                node = path[-1]
+                for char in word[common:]:
+                    child = node.children[char] = TrieNode()
+                    node.mask |= letter_bit(char)
+                    path.append(child)
+                    node = child
+                node.is_word = True
+                node.count = 1
+                trie.size += 1
+                previous = word
+            close(0)
+        return trie
+
+    def fork(self):
+        """
+        Return a trie sharing every node with this one, for private edits
+
+        insert() and remove() on the fork copy a node the first time they
+        change it (path copying), so only the nodes on edited words' paths
+        are duplicated, everything else stays shared, and this trie is
+        never modified. This trie must not be edited itself while forks
+        share its nodes.
+        """
+        fork = type(self)()
+        fork.root = self.root.copy()
+        fork.size = self.size
+        fork._owned = {id(fork.root)}
+        return fork
+
+    def _writable(self, node, char):
+        """Return node's child on char, copying it first if it is shared"""
+        child = node.children[char]
+        owned = self._owned
+        if owned is not None and id(child) not in owned:
+            child = node.children[char] = child.copy()
+            owned.add(id(child))
+        return child
 
     def insert(self, word):
         """Insert a word into the trie"""
+        if self.search(word):
+            return
+        self.size += 1
         node = self.root
-        for char in word:
-            if char not in node.children:
-                node.children[char] = TrieNode()
-            node = node.children[char]
+        for i, char in enumerate(word):
+            node.count += 1
+            if node.longest < len(word) - i:
+                node.longest = len(word) - i
+            if char in node.children:
+                node = self._writable(node, char)
+            else:
+                child = node.children[char] = TrieNode()
+                node.mask |= letter_bit(char)
+                if self._owned is not None:
+                    self._owned.add(id(child))
+                node = child
         node.is_word = True
+        node.count += 1
+
+    def remove(self, word):
+        """
+        Remove a word from the trie, pruning nodes no word passes through
+
+        Args:
+            word: word to remove
+
+        Returns:
+            True if the word was stored and has been removed
+        """
+        if not self.search(word):
+            return False
+        path = [self.root]
+        for char in word:
+            path.append(self._writable(path[-1], char))
+        path[-1].is_word = False
+        self.size -= 1
+        for node in path:
+            node.count -= 1
+
+        # Walk back up: drop empty branches, then refresh mask and height
+        for depth in range(len(word), -1, -1):
+            node = path[depth]
+            if depth and not node.is_word and not node.children:
+                del path[depth - 1].children[word[depth - 1]]
+                continue
+            node.mask = 0
+            node.longest = 0
+            for char, child in node.children.items():
+                node.mask |= letter_bit(char)
+                if node.longest < child.longest + 1:
+                    node.longest = child.longest + 1
+        return True
+
+    def __len__(self):
+        return self.size
 
     def search(self, word):
         """Check if a word exists in the trie"""
@@ -52,38 +830,108 @@ class Trie:
             node = node.children[char]
         return True
 
+    def step(self, node, chars):
+        """
+        Follow the child edges for chars starting at node
+
+        Args:
+            node: TrieNode to start from (self.root for the empty prefix)
+            chars: string of characters to consume (a whole tile, e.g. "qu")
+
+        Returns:
+            The TrieNode reached, or None if the prefix leaves the trie
+        """
+        for char in chars:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def is_word(self, node):
+        """Check if the prefix that reached node is a complete word"""
+        return node.is_word
+
+    def child_mask(self, node):
+        """Return the letter_bit() mask of the characters that can follow node"""
+        return node.mask
+
+    def max_remaining(self, node):
+        """Return how many more characters the longest word below node needs"""
+        return node.longest
+
+    def height(self):
+        """Return the length of the longest word in the trie"""
+        return self.root.longest
+
+    def word_count(self, node):
+        """Return the number of words ending at or below node"""
+        return node.count
+
+    def children(self, node):
+        """Return (char, child) pairs of node's outgoing edges"""
+        return node.children.items()
+
 
 class Boggle:
-    def __init__(self, grid, dictionary):
+    def __init__(self, grid, dictionary, index_class=None, engine="recursive",
+                 workers=1, solution_cache=None, prefilter=False, pool="process",
+                 instrument=False, stats_hook=None):
         """
         Constructor for Boggle class
 
         Args:
             grid: 2D array of strings representing the game board
             dictionary: array of words to search for
+            index_class: class used to index the dictionary; must provide
+                from_words and INDEX_METHODS like Trie (default Trie, or
+                packed_trie.PackedTrie / dawg.Dawg for compact indexes,
+                sorted_index.SortedIndex to skip building nodes)
+            engine: search strategy, one of ENGINES; "bitmask" walks flat
+                cell indexes with cached neighbor tables and tracks the
+                path as an integer bitmask; "masked" additionally skips
+                neighbors whose first letter is not a child of the current
+                trie node; "pruned" also skips branches whose words were all
+                found already and returns words in trie order; "iterative"
+                walks an explicit stack instead of recursing
+            workers: number of processes getSolution splits the start
+                cells across (default 1, no pool); None uses every CPU
+            solution_cache: optional SolutionCache consulted by getSolution
+            prefilter: if True, search each board against a sub-index of
+                only the words its letters and adjacent letter pairs allow
+                (see board_filter)
+            pool: "process" or "thread", what getSolution splits the start
+                cells across when workers > 1; threads share one index
+                and scale on free-threaded Python builds
+            instrument: if True, getSolution records search counters and
+                phase timings, returned by getStats(); off, solves search
+                the index directly and pay nothing for it
+            stats_hook: optional callable given the stats dict of every
+                instrumented solve; setting it turns instrument on
         """
-        # Store grid (handle None or empty gracefully)
-        if grid and len(grid) > 0:
-            # Convert grid to lowercase
-            self.grid = [[cell.lower() for cell in row] for row in grid]
-        else:
-            self.grid = []
+        if engine not in ENGINES:
+            raise ValueError(f"Unknown engine {engine!r}, expected one of {ENGINES}")
+        if pool not in POOLS:
+            raise ValueError(f"Unknown pool {pool!r}, expected one of {POOLS}")
+        self.engine = engine
+        self.workers = workers
+        self.pool = pool
+        self.solution_cache = solution_cache
+        self.prefilter = prefilter
+        self.index_class = index_class or Trie
+        check_index(self.index_class)
+        self.instrument = instrument or stats_hook is not None
+        self.stats_hook = stats_hook
+        self.stats = None  # stats of the last instrumented solve
 
-        # Store dictionary (handle None or empty gracefully)
-        if dictionary and len(dictionary) > 0:
-            # Convert dictionary to lowercase and filter valid words only
-            # Valid words: strings, alphabetic only, at least 3 characters
-            self.dictionary = [
-                word.lower() for word in dictionary
-                if isinstance(word, str) and word.isalpha() and len(word) >= 3
-            ]
-        else:
-            self.dictionary = []
+        # Seconds spent in setGrid/setDictionary since the last solve,
+        # charged to the next instrumented solve
+        self._setup_seconds = {}
+
+        # Store grid (handle None or empty gracefully)
+        self.setGrid(grid)
 
-        # Build Trie from dictionary for fast prefix/word lookup
-        self.trie = Trie()
-        for word in self.dictionary:
-            self.trie.insert(word)
+        # Store dictionary and build the index for fast prefix/word lookup
+        self.setDictionary(dictionary)
 
         # Solution set to store found words (automatically handles duplicates)
         self.solution = set()
@@ -95,6 +943,7 @@ class Boggle:
         Args:
             grid: 2D array of strings
         """
+        start = time.perf_counter()
         # Store grid (handle None or empty gracefully)
         if grid and len(grid) > 0:
             # Convert grid to lowercase
@@ -102,6 +951,11 @@ class Boggle:
         else:
             self.grid = []
 
+        # Witness paths of the last updateGrid() belong to the old grid
+        self._witnesses = None
+        if self.instrument:
+            _charge(self._setup_seconds, "normalize", start)
+
     def setDictionary(self, dictionary):
         """
         Sets the dictionary to an array of words
@@ -109,50 +963,191 @@ class Boggle:
         Args:
             dictionary: array of words
         """
+        start = time.perf_counter()
         # Store dictionary (handle None or empty gracefully)
-        if dictionary and len(dictionary) > 0:
-            # Convert dictionary to lowercase and filter valid words only
-            # Valid words: strings, alphabetic only, at least 3 characters
-            self.dictionary = [
-                word.lower() for word in dictionary
-                if isinstance(word, str) and word.isalpha() and len(word) >= 3
-            ]
+        # Valid words: strings, alphabetic only, at least 3 characters
+        self.dictionary = filter_words(dictionary)
+        if self.instrument:
+            start = _charge(self._setup_seconds, "filter", start)
+
+        # Per-board filter tables are rebuilt lazily for the new word list
+        self._word_filter = None
+        self._witnesses = None
+
+        # Reuse the shared index for an identical dictionary, or build one
+        key = dictionary_key(self.dictionary, self.index_class)
+        self._index_state = (cached_index(self.dictionary, self.index_class, key), key)
+        if self.instrument:
+            _charge(self._setup_seconds, "build", start)
+
+    def setIndex(self, index):
+        """
+        Sets a prebuilt dictionary index, e.g. a memory-mapped snapshot
+
+        The word list behind a prebuilt index is not kept, so
+        self.dictionary is set to None and the index is identified by
+        object identity.
+
+        Args:
+            index: object providing root/step/is_word/__len__ like Trie
+        """
+        check_index(index)
+        self.dictionary = None
+        self._word_filter = None
+        self._witnesses = None
+        self._index_state = (index, prebuilt_index_key(index))
+
+    # The index and its key are published as one tuple, so a solve reading
+    # both while the dictionary is being edited or replaced sees either the
+    # old pair or the new one, never the new index under the old key
+
+    @property
+    def trie(self):
+        """Dictionary index being searched"""
+        return self._index_state[0]
+
+    @property
+    def dictionary_key(self):
+        """Key of the index: dictionary_key() of the words, or a prebuilt key"""
+        return self._index_state[1]
+
+    def addWords(self, words):
+        """
+        Adds words to the dictionary without rebuilding the index
+
+        Words are filtered like setDictionary. No index is ever modified
+        while it is in use: each edit applies to a fork() of the current
+        index that copies only what the edit touches (index classes
+        without fork() and insert() are rebuilt instead), and the edited
+        index replaces the current one when it is complete, so solves
+        running on other threads are unaffected. Cached solutions that none
+        of the new words appear in are carried over to the edited
+        dictionary.
+
+        Args:
+            words: array of words to add
+
+        Returns:
+            Number of words that were not already in the dictionary
+        """
+        index = self.trie
+        added = [word for word in dict.fromkeys(filter_words(words))
+                 if not index.search(word)]
+        if added:
+            self._edit_dictionary(added, "insert")
+        return len(added)
+
+    def removeWords(self, words):
+        """
+        Removes words from the dictionary without rebuilding the index
+
+        Nodes left without words below them are pruned from the index.
+        Like addWords, the edit applies to a fork of the current index,
+        and cached solutions are carried over minus removed words.
+
+        Args:
+            words: array of words to remove
+
+        Returns:
+            Number of words that were in the dictionary
+        """
+        index = self.trie
+        removed = [word for word in dict.fromkeys(filter_words(words))
+                   if index.search(word)]
+        if removed:
+            self._edit_dictionary(removed, "remove")
+        return len(removed)
+
+    def _edit_dictionary(self, words, operation):
+        """
+        Applies an addWords/removeWords edit to the word list and index
+
+        Args:
+            words: filtered, deduplicated words that change membership
+            operation: "insert" or "remove"
+        """
+        if self.dictionary is None:
+            raise ValueError("a prebuilt index set with setIndex cannot be edited")
+        if operation == "insert":
+            dictionary = self.dictionary + words
         else:
-            self.dictionary = []
+            gone = set(words)
+            dictionary = [word for word in self.dictionary if word not in gone]
 
-        # Rebuild Trie with new dictionary
-        self.trie = Trie()
-        for word in self.dictionary:
-            self.trie.insert(word)
+        # Edit a fresh fork, which copies only the parts the edit touches:
+        # the current index may be shared through the index cache or in
+        # use by a solve on another thread
+        old_index, old_key = self._index_state
+        if hasattr(old_index, "fork") and hasattr(old_index, operation):
+            index = old_index.fork()
+            edit = getattr(index, operation)
+            for word in words:
+                edit(word)
+        else:
+            index = self.index_class.from_words(dictionary)
 
-    def _dfs(self, row, col, current_word, visited):
+        self.dictionary = dictionary
+        self._word_filter = None
+        self._witnesses = None
+        new_key = dictionary_key(dictionary, self.index_class)
+        self._index_state = (index, new_key)
+        if self.solution_cache is None:
+            return
+
+        if operation == "remove":
+            def update(grid, bounds, found):
+                return [word for word in found if word not in gone]
+        else:
+            probe = Boggle([], None, engine="bitmask")
+            probe.setIndex(Trie.from_words(words))
+
+            def update(grid, bounds, found):
+                probe.setGrid(grid)
+                return None if probe.getSolution(*bounds) else found
+        self.solution_cache.carry_over(old_key, new_key, update)
+
+    def _dfs(self, grid, row, col, node, current_word, visited, index, bounds, solution):
         """
         DFS helper method to explore words starting from a given position
 
         Args:
+            grid: NxN 2D array of lowercase tiles to search
             row: current row position
             col: current column position
+            node: trie node reached by current_word
             current_word: word built so far
             visited: set of (row, col) tuples already used in current path
+            index: dictionary index being searched (self.trie or a
+                per-board sub-index)
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
         """
+        # Get cell value (handles multi-character tiles) and step the trie
+        # cursor one tile forward instead of re-walking from the root
+        cell_value = grid[row][col]
+        node = index.step(node, cell_value)
+
+        # Early termination: if prefix doesn't exist in trie, stop exploring
+        if node is None:
+            return
+
         # Mark current cell as visited
         visited.add((row, col))
-
-        # Get cell value (handles multi-character tiles)
-        cell_value = self.grid[row][col]
         current_word += cell_value
 
-        # Early termination: if prefix doesn't exist in trie, stop exploring
-        if not self.trie.starts_with(current_word):
+        # If valid word (within the length bounds, >= 3 chars) and exists
+        # in trie, add to solution
+        lo, hi = bounds
+        if lo <= len(current_word) <= hi and index.is_word(node):
+            solution.add(current_word)
+
+        # Stop once no longer word may be reported
+        if len(current_word) >= hi:
             visited.remove((row, col))
             return
 
-        # If valid word (>= 3 chars) and exists in trie, add to solution
-        if len(current_word) >= 3 and self.trie.search(current_word):
-            self.solution.add(current_word)
-
         # Explore all 8 adjacent neighbors (including diagonals)
-        n = len(self.grid)
+        n = len(grid)
         directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
 
         for dr, dc in directions:
@@ -161,55 +1156,995 @@ class Boggle:
             # Check if neighbor is valid and not visited
             if (0 <= new_row < n and 0 <= new_col < n and
                 (new_row, new_col) not in visited):
-                self._dfs(new_row, new_col, current_word, visited)
+                self._dfs(grid, new_row, new_col, node, current_word, visited, index,
+                          bounds, solution)
 
         # Backtrack: remove current cell from visited
         visited.remove((row, col))
 
-    def getSolution(self):
+    def _solve_bitmask(self, grid, starts, index, bounds, solution):
+        """
+        Bitmask engine: explore from start cells over flattened grid indexes
+
+        The path is an int with bit i set when cell i is in use, so marking
+        and backtracking are free and nothing is allocated per neighbor.
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            starts: iterable of start cell indexes
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+        """
+        n = len(grid)
+        cells = [cell for row in grid for cell in row]
+        neighbors = neighbor_table(n)
+        step = index.step
+        is_word = index.is_word
+        remaining = _remaining_pruner(index, bounds)
+        lo, hi = bounds
+
+        def dfs(cell, node, current_word, path):
+            tile = cells[cell]
+            node = step(node, tile)
+            if node is None:
+                return
+            current_word += tile
+            length = len(current_word)
+            if lo <= length <= hi and is_word(node):
+                solution.add(current_word)
+            if length >= hi or (remaining and length + remaining(node) < lo):
+                return
+            path |= 1 << cell
+            for neighbor in neighbors[cell]:
+                if not path >> neighbor & 1:
+                    dfs(neighbor, node, current_word, path)
+
+        root = index.root
+        for cell in starts:
+            dfs(cell, root, "", 0)
+
+    def _solve_masked(self, grid, starts, index, bounds, solution):
+        """
+        Masked engine: bitmask engine plus letter-mask pruning
+
+        Each trie node's child_mask() (first letters that can follow) is
+        AND-ed with the first letters of the cell's neighbors; a neighbor is
+        only visited when its tile can continue the prefix, and a cell with
+        no possible continuation skips its neighbor loop entirely. Empty
+        tiles match every letter. Falls back to the bitmask engine for
+        indexes without child_mask().
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            starts: iterable of start cell indexes
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+        """
+        child_mask = getattr(index, "child_mask", None)
+        if child_mask is None:
+            self._solve_bitmask(grid, starts, index, bounds, solution)
+            return
+
+        n = len(grid)
+        cells = [cell for row in grid for cell in row]
+        neighbors = neighbor_table(n)
+        first_bits = [letter_bit(tile[0]) if tile else -1 for tile in cells]
+        around = [0] * len(cells)
+        for cell, adjacent in enumerate(neighbors):
+            for neighbor in adjacent:
+                around[cell] |= first_bits[neighbor]
+        step = index.step
+        is_word = index.is_word
+        remaining = _remaining_pruner(index, bounds)
+        lo, hi = bounds
+
+        def dfs(cell, node, current_word, path):
+            tile = cells[cell]
+            node = step(node, tile)
+            if node is None:
+                return
+            current_word += tile
+            length = len(current_word)
+            if lo <= length <= hi and is_word(node):
+                solution.add(current_word)
+            if length >= hi or (remaining and length + remaining(node) < lo):
+                return
+            mask = child_mask(node)
+            if not mask & around[cell]:
+                return
+            path |= 1 << cell
+            for neighbor in neighbors[cell]:
+                if mask & first_bits[neighbor] and not path >> neighbor & 1:
+                    dfs(neighbor, node, current_word, path)
+
+        root = index.root
+        root_mask = child_mask(root)
+        for cell in starts:
+            if root_mask & first_bits[cell]:
+                dfs(cell, root, "", 0)
+
+    def _solve_pruned(self, grid, starts, index, bounds, solution):
+        """
+        Pruned engine: masked engine that cuts off exhausted trie branches
+
+        A per-solve overlay counts, for every touched node, how many words
+        below it are still unfound (starting from index.word_count()); a
+        branch whose count reaches zero is never walked again, and the
+        search ends once every word is found. Words are only spelled out
+        at the end, by walking the found nodes in character order, so the
+        result is already sorted. The shared index is never modified.
+
+        Needs a tree-shaped index with word_count()/children() (Trie,
+        PackedTrie); other indexes fall back to the masked engine.
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            starts: iterable of start cell indexes
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+
+        Returns:
+            Sorted list of found words, or None after a fallback
+        """
+        if not getattr(index, "tree_shaped", False) or not hasattr(index, "word_count"):
+            self._solve_masked(grid, starts, index, bounds, solution)
+            return None
+
+        n = len(grid)
+        cells = [cell for row in grid for cell in row]
+        neighbors = neighbor_table(n)
+        first_bits = [letter_bit(tile[0]) if tile else -1 for tile in cells]
+        around = [0] * len(cells)
+        for cell, adjacent in enumerate(neighbors):
+            for neighbor in adjacent:
+                around[cell] |= first_bits[neighbor]
+        step = index.step
+        is_word = index.is_word
+        child_mask = index.child_mask
+        word_count = index.word_count
+        remaining = _remaining_pruner(index, bounds)
+        lo, hi = bounds
+
+        left = {}     # node -> words below it not found yet (touched nodes only)
+        found = set()  # nodes of found words
+        root = index.root
+        trail = []    # tiles on the current path
+        # Re-walking a found word is bookkeeping, not search: keep it out
+        # of the counters of an instrumented solve
+        walk = index.uncounted_step if isinstance(index, _CountingIndex) else step
+
+        def mark_found(node):
+            # Count the word off every node it passes through, including
+            # the inner nodes of multi-letter tiles
+            found.add(node)
+            on_path = root
+            left[root] = left.get(root, word_count(root)) - 1
+            for tile in trail:
+                for char in tile:
+                    on_path = walk(on_path, char)
+                    left[on_path] = left.get(on_path, word_count(on_path)) - 1
+
+        def dfs(cell, node, length, path):
+            tile = cells[cell]
+            node = step(node, tile)
+            if node is None or left.get(node) == 0:
+                return
+            length += len(tile)
+            trail.append(tile)
+            if lo <= length <= hi and node not in found and is_word(node):
+                mark_found(node)
+            if (length < hi and left.get(node) != 0 and
+                    not (remaining and length + remaining(node) < lo)):
+                mask = child_mask(node)
+                if mask & around[cell]:
+                    path |= 1 << cell
+                    for neighbor in neighbors[cell]:
+                        if mask & first_bits[neighbor] and not path >> neighbor & 1:
+                            dfs(neighbor, node, length, path)
+            trail.pop()
+
+        root_mask = child_mask(root)
+        for cell in starts:
+            if left.get(root) == 0:
+                break
+            if root_mask & first_bits[cell]:
+                dfs(cell, root, 0, 0)
+
+        # Spell out found words in order, only entering touched subtrees
+        ordered = []
+        children = index.children
+
+        def collect(node, prefix):
+            if node in found:
+                ordered.append(prefix)
+            for char, child in sorted(children(node)):
+                if child in left:
+                    collect(child, prefix + char)
+
+        if root in left:
+            collect(root, "")
+        solution.update(ordered)
+        return ordered
+
+    def _solve_iterative(self, grid, starts, index, bounds, solution):
+        """
+        Iterative engine: depth-first search on an explicit, preallocated stack
+
+        Each stack level holds a cell, the trie node reached through it,
+        the word length so far and a cursor into the cell's neighbor list;
+        advancing the cursor replaces a recursive call, so paths can be as
+        long as the board allows regardless of the recursion limit. Words
+        are joined from the tiles on the stack only when accepted.
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            starts: iterable of start cell indexes
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+        """
+        n = len(grid)
+        cells = [cell for row in grid for cell in row]
+        neighbors = neighbor_table(n)
+        step = index.step
+        is_word = index.is_word
+        remaining = _remaining_pruner(index, bounds)
+        lo, hi = bounds
+        root = index.root
+
+        size = n * n
+        stack_cell = [0] * size
+        stack_node = [None] * size
+        stack_length = [0] * size
+        stack_cursor = [0] * size
+        done = 8  # cursor value that pops a level (no cell has more neighbors)
+
+        for start in starts:
+            node = step(root, cells[start])
+            if node is None:
+                continue
+            depth = 0
+            cell = start
+            length = len(cells[start])
+            path = 1 << start
+            while True:
+                # Entering a new level: record it, report and bound it
+                stack_cell[depth] = cell
+                stack_node[depth] = node
+                stack_length[depth] = length
+                stack_cursor[depth] = 0
+                if lo <= length <= hi and is_word(node):
+                    solution.add("".join([cells[c] for c in stack_cell[:depth + 1]]))
+                if length >= hi or (remaining and length + remaining(node) < lo):
+                    stack_cursor[depth] = done
+
+                # Advance the cursor of the deepest level until a neighbor
+                # extends the prefix, popping exhausted levels
+                while depth >= 0:
+                    cell = stack_cell[depth]
+                    adjacent = neighbors[cell]
+                    cursor = stack_cursor[depth]
+                    node = None
+                    while cursor < len(adjacent):
+                        neighbor = adjacent[cursor]
+                        cursor += 1
+                        if not path >> neighbor & 1:
+                            node = step(stack_node[depth], cells[neighbor])
+                            if node is not None:
+                                break
+                    if node is not None:
+                        stack_cursor[depth] = cursor
+                        length = stack_length[depth] + len(cells[neighbor])
+                        cell = neighbor
+                        path |= 1 << cell
+                        depth += 1
+                        break
+                    path ^= 1 << cell
+                    depth -= 1
+                if depth < 0:
+                    break
+
+    def _search(self, grid, starts, index, bounds, solution):
+        """
+        Runs the configured engine from start cells, adding to solution
+
+        Only reads the solver's settings, so concurrent calls with their
+        own solution sets do not interfere.
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            starts: iterable of start cell indexes (row * n + col)
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+
+        Returns:
+            The found words in sorted order if the engine produced them
+            that way, else None
+        """
+        if self.engine == "pruned":
+            return self._solve_pruned(grid, starts, index, bounds, solution)
+        if self.engine == "bitmask":
+            self._solve_bitmask(grid, starts, index, bounds, solution)
+        elif self.engine == "masked":
+            self._solve_masked(grid, starts, index, bounds, solution)
+        elif self.engine == "iterative":
+            self._solve_iterative(grid, starts, index, bounds, solution)
+        else:
+            n = len(grid)
+            for cell in starts:
+                row, col = divmod(cell, n)
+                visited = set()
+                self._dfs(grid, row, col, index.root, "", visited, index, bounds, solution)
+
+    def _search_parallel(self, grid, workers, index, bounds, solution):
+        """
+        Splits the start cells across a worker pool and merges the results
+
+        With pool="process", each worker receives this solver once through
+        the pool initializer, inherited without pickling where the fork
+        start method exists; tasks only carry their start cell indexes.
+        With pool="thread", threads share the index and each fills its own
+        set; this scales on free-threaded Python builds and is still
+        correct, if not faster, under the GIL.
+
+        Args:
+            grid: NxN 2D array of lowercase tiles to search
+            workers: number of worker processes or threads
+            index: dictionary index being searched
+            bounds: (lo, hi) word lengths to report, from word_bounds()
+            solution: set the found words are added to
+        """
+        # Interleave cells so every task gets a mix of centre and edge cells
+        size = len(grid) * len(grid)
+        tasks = min(size, workers * 4)
+        chunks = [range(i, size, tasks) for i in range(tasks)]
+        counting = isinstance(index, _CountingIndex)
+        if self.pool == "thread":
+            # Instrumented threads count on their own wrappers, merged after
+            indexes = [_CountingIndex(index.index) if counting else index for _ in chunks]
+            with ThreadPoolExecutor(workers) as executor:
+                parts = [set() for _ in chunks]
+                for _ in executor.map(self._search, itertools.repeat(grid), chunks,
+                                      indexes, itertools.repeat(bounds), parts):
+                    pass
+            for words, part_index in zip(parts, indexes):
+                solution.update(words)
+                if counting:
+                    index.add_counts(part_index.counts())
+            return
+
+        with _pool_context().Pool(workers, _init_worker,
+                                  (self, index, bounds, grid)) as pool:
+            for words in pool.imap_unordered(_solve_cells, chunks):
+                if counting:
+                    words, counts = words
+                    index.add_counts(counts)
+                solution.update(words)
+
+    def _board_size(self, grid, index):
+        """
+        Validates the grid and dictionary before a solve
+
+        Args:
+            grid: 2D array of lowercase tiles
+            index: dictionary index to search
+
+        Returns:
+            Grid size n, or 0 if the grid is empty/not square or the
+            dictionary is empty
+        """
+        # Check for invalid grid (empty or not set)
+        if not grid or len(grid) == 0:
+            return 0
+
+        # Check if grid is NxN (square)
+        n = len(grid)
+        for row in grid:
+            if len(row) != n:
+                return 0  # Not a square grid
+
+        # Check for empty dictionary
+        if len(index) == 0:
+            return 0
+        return n
+
+    def _search_index(self, grid, index, seconds=None):
+        """
+        Returns the index to search for grid
+
+        With prefilter on, words the board cannot form (missing letters or
+        letter pairs) are dropped and the rest are indexed for this board
+        only; otherwise the shared dictionary index is used. The time
+        spent filtering and building is added to seconds, if given.
+        """
+        dictionary = self.dictionary
+        if not self.prefilter or dictionary is None:
+            return index
+        start = time.perf_counter()
+        word_filter = self._word_filter
+        if word_filter is None:
+            from board_filter import WordFilter
+            word_filter = self._word_filter = WordFilter(dictionary)
+        words = word_filter.feasible(grid)
+        filtered = time.perf_counter()
+        index = self.index_class.from_words(words)
+        if seconds is not None:
+            seconds["filter"] += filtered - start
+            seconds["build"] += time.perf_counter() - filtered
+        return index
+
+    def iterSolution(self, time_budget=None, max_words=None,
+                     min_word_length=None, max_word_length=None):
+        """
+        Yields found words one at a time, as soon as the search reaches them
+
+        Words come out in discovery order, each once. The search stops early
+        once time_budget seconds have passed or max_words words were
+        yielded; self.solution holds the words yielded so far, until
+        another solve replaces it.
+
+        Args:
+            time_budget: optional wall-clock limit in seconds
+            max_words: optional maximum number of words to yield
+            min_word_length: optional shortest word length to report
+            max_word_length: optional longest word length to report
+
+        Yields:
+            Found words (lowercase)
+        """
+        solution = self.solution = set()
+        if max_words is not None and max_words <= 0:
+            return
+        grid = self.grid
+        index, dictionary_key = self._index_state
+        try:
+            n = self._board_size(grid, index)
+            if n == 0:
+                return
+        except Exception:
+            return
+
+        bounds = word_bounds(min_word_length, max_word_length)
+        key = None
+        if self.solution_cache is not None:
+            key = (dictionary_key, canonical_grid(grid), bounds)
+            words = self.solution_cache.get(key)
+            if words is not None:
+                for word in words[:max_words]:
+                    solution.add(word)
+                    yield word
+                return
+
+        deadline = None if time_budget is None else time.monotonic() + time_budget
+        index = self._search_index(grid, index)
+        cells = [cell for row in grid for cell in row]
+        neighbors = neighbor_table(n)
+        step = index.step
+        is_word = index.is_word
+        remaining = _remaining_pruner(index, bounds)
+        lo, hi = bounds
+        calls = [0]
+
+        def dfs(cell, node, current_word, path):
+            if deadline is not None:
+                calls[0] += 1
+                if calls[0] & 1023 == 0 and time.monotonic() >= deadline:
+                    raise _BudgetExhausted
+            tile = cells[cell]
+            node = step(node, tile)
+            if node is None:
+                return
+            current_word += tile
+            length = len(current_word)
+            if lo <= length <= hi and current_word not in solution and is_word(node):
+                solution.add(current_word)
+                yield current_word
+            if length >= hi or (remaining and length + remaining(node) < lo):
+                return
+            path |= 1 << cell
+            for neighbor in neighbors[cell]:
+                if not path >> neighbor & 1:
+                    yield from dfs(neighbor, node, current_word, path)
+
+        root = index.root
+        try:
+            for cell in range(n * n):
+                if deadline is not None and time.monotonic() >= deadline:
+                    return
+                for word in dfs(cell, root, "", 0):
+                    yield word
+                    if max_words is not None and len(solution) >= max_words:
+                        return
+        except _BudgetExhausted:
+            return
+
+        if key is not None:
+            self.solution_cache.put(key, sorted(solution))
+
+    def _find_witnesses(self, n, index, witnesses, prefixes=None, stale=None,
+                        edited=None):
+        """
+        Masked search that records one witness path per found word
+
+        Args:
+            n: grid size
+            index: dictionary index being searched
+            witnesses: dict word -> path (cell bitmask); words already in
+                it are skipped, new ones are added
+            prefixes: optional list holding, for every cell, the
+                (node, path bitmask, prefix) states of the extendable
+                prefixes whose path ends there; each prefix the search walks
+                is appended
+            stale: list holding, for every cell, the bitmask of cells
+                edited since that cell's prefixes were last used (required
+                with prefixes); prefixes through them no longer spell their
+                prefix and are dropped before the cell's list is used
+            edited: optional cells whose tiles changed since prefixes was
+                filled; when given, only paths through an edited cell are
+                searched, by starting at edited cells and extending the
+                stored prefixes that end next to one
+        """
+        cells = [cell for row in self.grid for cell in row]
+        neighbors = neighbor_table(n)
+        first_bits = [letter_bit(tile[0]) if tile else -1 for tile in cells]
+        around = [0] * len(cells)
+        for cell, adjacent in enumerate(neighbors):
+            for neighbor in adjacent:
+                around[cell] |= first_bits[neighbor]
+        step = index.step
+        is_word = index.is_word
+        child_mask = getattr(index, "child_mask", None) or (lambda node: -1)
+
+        def fresh(cell):
+            # Dropping prefixes lazily spares cells no search reaches
+            edited_since = stale[cell]
+            if edited_since:
+                prefixes[cell] = [prefix for prefix in prefixes[cell]
+                                  if not prefix[1] & edited_since]
+                stale[cell] = 0
+            return prefixes[cell]
+
+        def dfs(cell, node, current_word, path):
+            tile = cells[cell]
+            node = step(node, tile)
+            if node is None:
+                return
+            current_word += tile
+            path |= 1 << cell
+            if (len(current_word) >= 3 and current_word not in witnesses and
+                    is_word(node)):
+                witnesses[current_word] = path
+            mask = child_mask(node)
+            if mask:
+                # Kept even if no neighbor fits now; an edit may add one
+                if prefixes is not None:
+                    fresh(cell).append((node, path, current_word))
+                if mask & around[cell]:
+                    for neighbor in neighbors[cell]:
+                        if mask & first_bits[neighbor] and not path >> neighbor & 1:
+                            dfs(neighbor, node, current_word, path)
+
+        root = index.root
+        root_mask = child_mask(root)
+        starts = range(n * n) if edited is None else edited
+        # Fresh prefixes avoid every edited cell, so each new path is
+        # continued from the prefix before its first edited cell only
+        seeds = [] if edited is None else [
+            (cell, prefix) for cell in edited for neighbor in neighbors[cell]
+            for prefix in fresh(neighbor)
+            if child_mask(prefix[0]) & first_bits[cell]]
+        for cell in starts:
+            if root_mask & first_bits[cell]:
+                dfs(cell, root, "", 0)
+        for cell, (node, path, current_word) in seeds:
+            dfs(cell, node, current_word, path)
+
+    def updateGrid(self, changes):
+        """
+        Applies tile edits and returns the new solution incrementally
+
+        Every found word keeps one witness path, and every extendable
+        prefix the search walked is kept with its path. After an edit,
+        words whose witness avoids the edited cells are reused as is, and
+        so are words whose witness still spells them across the new tiles.
+        New words are searched only along paths through an edited cell, by
+        continuing the kept prefixes that end next to one, pruned by letter
+        masks like the masked engine. Lost words not found again there are
+        searched for with a small index of just those words. The first call
+        (or any call after setGrid/setDictionary/setIndex) does a full
+        solve to record witnesses and prefixes; the prefixes take memory
+        in proportion to the search, a few MiB for a 10x10 board.
+
+        Args:
+            changes: iterable of (row, col, tile) edits
+
+        Returns:
+            Sorted list of found words, or empty list for an invalid grid
+        """
+        changes = list(changes)
+        n = len(self.grid)
+        for row, col, tile in changes:
+            if not (0 <= row < n and 0 <= col < len(self.grid[row])):
+                raise ValueError(f"Cell ({row}, {col}) is outside the grid")
+
+        # (witnesses, prefixes, stale) of the last call, see _find_witnesses
+        state = self._witnesses
+        changed = 0
+        for row, col, tile in changes:
+            self.grid[row][col] = tile.lower()
+            changed |= 1 << (row * n + col)
+
+        self.solution = set()
+        self._witnesses = None
+        index = self.trie
+        if self._board_size(self.grid, index) == 0:
+            return []
+
+        if state is None:
+            witnesses, prefixes, stale = {}, [[] for _ in range(n * n)], [0] * (n * n)
+            self._find_witnesses(n, index, witnesses, prefixes, stale)
+        elif changed:
+            witnesses, prefixes, stale = state
+            cells = [cell for row in self.grid for cell in row]
+            neighbors = neighbor_table(n)
+            kept = {}
+            suspects = []
+            for word, path in witnesses.items():
+                if path & changed:
+                    # The old path may still spell the word with the new tiles
+                    path = _trace_word(cells, neighbors, word, path)
+                if path:
+                    kept[word] = path
+                else:
+                    suspects.append(word)
+
+            stale = [edited_since | changed for edited_since in stale]
+            edited = sorted({row * n + col for row, col, _ in changes})
+            self._find_witnesses(n, index, kept, prefixes, stale, edited)
+            suspects = [word for word in suspects if word not in kept]
+            if suspects:
+                self._find_witnesses(n, Trie.from_words(suspects), kept)
+            witnesses = kept
+        else:
+            witnesses, prefixes, stale = state
+
+        self._witnesses = (witnesses, prefixes, stale)
+        self.solution = set(witnesses)
+        return sorted(witnesses)
+
+    def getSolution(self, min_word_length=None, max_word_length=None):
         """
         Returns the solution list of found words
 
+        Args:
+            min_word_length: optional shortest word length to report
+                (lengths below 3 are treated as 3)
+            max_word_length: optional longest word length to report; the
+                search stops extending paths at this length
+
         Returns:
             Sorted list of found words, or empty list if error or invalid input
         """
-        try:
-            # Reset solution set
-            self.solution = set()
+        if not self.instrument:
+            return self._solve(min_word_length, max_word_length, None)
 
-            # Check for invalid grid (empty or not set)
-            if not self.grid or len(self.grid) == 0:
-                return []
+        # Published outside _solve, so errors in the hook reach the caller
+        stats = self._start_stats()
+        result = self._solve(min_word_length, max_word_length, stats)
+        stats["words_found"] = len(result)
+        self.stats = stats
+        if self.stats_hook is not None:
+            self.stats_hook(stats)
+        return result
 
-            # Check if grid is NxN (square)
-            n = len(self.grid)
-            for row in self.grid:
-                if len(row) != n:
-                    return []  # Not a square grid
+    def _solve(self, min_word_length, max_word_length, stats):
+        """
+        Solves the current grid for getSolution
+
+        Args:
+            min_word_length: as for getSolution
+            max_word_length: as for getSolution
+            stats: dict from _start_stats() to fill in, or None
 
-            # Check for empty dictionary
-            if not self.dictionary or len(self.dictionary) == 0:
+        Returns:
+            Sorted list of found words, or empty list if error or invalid input
+        """
+        # Each call works on its own snapshot of the grid and index and
+        # its own result set, so threads may share one solver; self.solution
+        # only receives the finished result
+        grid = self.grid
+        index, dictionary_key = self._index_state
+        solution = set()
+        try:
+            # Check for invalid grid, non-square grid or empty dictionary
+            start = time.perf_counter()
+            n = self._board_size(grid, index)
+            if n == 0:
+                self.solution = solution
                 return []
+            if stats is not None:
+                stats["board_size"] = n
+
+            # Repeated (or rotated/reflected) boards come from the cache
+            bounds = word_bounds(min_word_length, max_word_length)
+            if self.solution_cache is not None:
+                key = (dictionary_key, canonical_grid(grid), bounds)
+                words = self.solution_cache.get(key)
+                if words is not None:
+                    self.solution = set(words)
+                    if stats is not None:
+                        stats["cached"] = True
+                        _charge(stats["seconds"], "normalize", start)
+                    return list(words)
 
             # Try starting from each cell in the grid
-            for row in range(n):
-                for col in range(n):
-                    visited = set()
-                    self._dfs(row, col, "", visited)
+            workers = self.workers or os.cpu_count() or 1
+            if stats is not None:
+                _charge(stats["seconds"], "normalize", start)
+                index = _CountingIndex(self._search_index(grid, index, stats["seconds"]))
+                start = time.perf_counter()
+            else:
+                index = self._search_index(grid, index)
+            ordered = None
+            if workers > 1:
+                self._search_parallel(grid, workers, index, bounds, solution)
+            else:
+                ordered = self._search(grid, range(n * n), index, bounds, solution)
+            if stats is not None:
+                start = _charge(stats["seconds"], "search", start)
+                (stats["dfs_calls"], stats["pruned"], stats["node_visits"],
+                 stats["max_depth"]) = index.counts()
 
             # Return as sorted list
-            return sorted(list(self.solution))
+            result = ordered if ordered is not None else sorted(list(solution))
+            if stats is not None:
+                _charge(stats["seconds"], "sort", start)
+            if self.solution_cache is not None:
+                self.solution_cache.put(key, result)
+            self.solution = solution
+            return result
 
         except Exception:
             # Return empty array on any error per requirements
+            self.solution = set()
             return []
 
-def main():
-    grid = [["T", "W", "Y", "R"], ["E", "N", "P", "H"],["G", "St", "Qu", "R"],["O", "N", "T", "A"]]
-    dictionary = ["art", "ego", "gent", "get", "net", "new", "newt", "prat", "pry", "qua", "quart", "quartz", "rat", "tar", "tarp", "ten", "went", "wet", "arty", "rhr", "not", "quar"]
-    
-    mygame = Boggle(grid, dictionary)
-    print(mygame.getSolution())
+    def _start_stats(self):
+        """Returns a fresh stats dict, charged with the pending setup time"""
+        seconds = dict.fromkeys(SOLVE_PHASES, 0.0)
+        setup, self._setup_seconds = self._setup_seconds, {}
+        for phase, elapsed in setup.items():
+            seconds[phase] += elapsed
+        return {"engine": self.engine, "board_size": 0, "cached": False,
+                "dfs_calls": 0, "pruned": 0, "node_visits": 0, "max_depth": 0,
+                "words_found": 0, "seconds": seconds}
+
+    def getStats(self):
+        """
+        Returns what the last instrumented getSolution call did
+
+        Counters come from the dictionary index as seen by the search:
+        dfs_calls counts tiles a prefix was extended with, pruned those
+        steps whose prefix no word starts with, node_visits the index
+        nodes entered and max_depth the longest prefix reached, in
+        characters. Seconds are split over SOLVE_PHASES; normalize,
+        filter and build include setGrid/setDictionary calls made since
+        the previous solve. Searches in worker processes or threads are
+        summed in.
+
+        Returns:
+            Dict with engine, board_size, cached (answered by the
+            solution cache), dfs_calls, pruned, node_visits, max_depth,
+            words_found and seconds (a dict by phase), or None if no
+            instrumented solve ran yet
+        """
+        stats = self.stats
+        if stats is None:
+            return None
+        return dict(stats, seconds=dict(stats["seconds"]))
+
+
+def solve_batch(grids, dictionary, workers=1, chunksize=16, index=None,
+                timings=False, in_flight=2, **options):
+    """
+    Solves many boards against one dictionary index
+
+    The index is built (or taken from index) once and reused for every
+    board. Solutions are yielded lazily in input order, so grids may be an
+    unbounded stream: with workers, at most workers * in_flight chunks are
+    read ahead of the solution being yielded.
+
+    Args:
+        grids: iterable of 2D arrays of strings
+        dictionary: array of words (ignored when index is given)
+        workers: number of processes to spread boards over (default 1,
+            solve in this process); None uses every CPU
+        chunksize: boards sent to a worker per task
+        index: optional prebuilt index, e.g. a memory-mapped snapshot
+        timings: if True, yield (solution, seconds spent solving) pairs
+        in_flight: chunks submitted per worker before waiting for results
+        **options: extra Boggle options such as engine or index_class
+
+    Yields:
+        The sorted solution list of each grid, in input order
+    """
+    boggle = Boggle([], None if index is not None else dictionary, **options)
+    if index is not None:
+        boggle.setIndex(index)
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        for grid in grids:
+            start = time.perf_counter()
+            boggle.setGrid(grid)
+            solution = boggle.getSolution()
+            yield (solution, time.perf_counter() - start) if timings else solution
+        return
+
+    # Pool.imap would drain grids as fast as it can, so chunks are
+    # submitted a window at a time and refilled as solutions are yielded
+    grids = iter(grids)
+    pending = deque()
+    with _pool_context().Pool(workers, _init_worker, (boggle,)) as pool:
+        while True:
+            while len(pending) < workers * in_flight:
+                chunk = list(itertools.islice(grids, chunksize))
+                if not chunk:
+                    break
+                pending.append(pool.apply_async(_solve_chunk, (chunk, timings)))
+            if not pending:
+                return
+            yield from pending.popleft().get()
+
+
+def load_index(path, index_class=None):
+    """
+    Loads a dictionary index from a snapshot or a word list file
+
+    Args:
+        path: trie snapshot (see trie_snapshot) or word list (plain,
+            gzip or bz2)
+        index_class: class to index a word list with (default Trie)
+
+    Returns:
+        The index; snapshots are memory-mapped rather than built
+    """
+    from trie_snapshot import MAGIC, load_snapshot
+    with open(path, 'rb') as file:
+        if file.read(len(MAGIC)) == MAGIC:
+            return load_snapshot(path)
+    return (index_class or Trie).from_words(iter_dictionary(path))
+
+
+def _read_boards(lines, records):
+    """
+    Parses JSON-lines boards, keeping each input record for the output
+
+    Each line is a grid (2D array of strings) or an object with a "grid"
+    member; blank lines are skipped. Lines that are not valid boards are
+    solved as empty grids and recorded with their error.
+
+    Args:
+        lines: iterable of text lines
+        records: deque the parsed record of every yielded grid is appended to
+
+    Yields:
+        Each grid in input order
+    """
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            grid = record["grid"] if isinstance(record, dict) else record
+            if not isinstance(grid, list) or not all(
+                    isinstance(row, list) and all(isinstance(tile, str) for tile in row)
+                    for row in grid):
+                raise ValueError("grid must be a 2D array of strings")
+        except (ValueError, KeyError, TypeError) as error:
+            record, grid = {"error": str(error)}, []
+        records.append(record)
+        yield grid
+
+
+def _peak_rss():
+    """Returns the peak RSS in bytes of this process and its workers, or None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    scale = 1 if sys.platform == "darwin" else 1024
+    return scale * max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                       resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+
+
+def main(argv=None, freeze_index=False):
+    """
+    Command line entry point: solve JSON-lines boards against one dictionary
+
+    Reads one board per line from a file or stdin and writes one JSON line
+    per board, in input order, as soon as it is solved: the word list for
+    a bare grid, or the input object with a "words" member added. Boards
+    are read only as far ahead as the workers need.
+
+    Args:
+        argv: command line arguments (default sys.argv[1:])
+        freeze_index: move the loaded index out of the garbage collector's
+            reach with gc.freeze(), so full collections do not rescan its
+            nodes. Frozen objects are never freed, so only the script entry
+            point, whose process ends with the run, sets this.
+    """
+    parser = argparse.ArgumentParser(
+        description="Solve Boggle boards given as JSON lines.")
+    parser.add_argument("dictionary",
+                        help="word list (plain, gzip or bz2) or trie snapshot")
+    parser.add_argument("boards", nargs="?", default="-",
+                        help="JSON-lines file of boards (default: stdin)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes (0 uses every CPU)")
+    parser.add_argument("--chunk-size", type=int, default=64,
+                        help="boards sent to a worker per task")
+    parser.add_argument("--engine", choices=ENGINES, default="masked",
+                        help="search engine")
+    parser.add_argument("--stats", action="store_true",
+                        help="print throughput, latency and memory to stderr")
+    args = parser.parse_args(argv)
+    if args.workers < 0:
+        parser.error("--workers must be >= 0")
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be >= 1")
+
+    start = time.perf_counter()
+    index = load_index(args.dictionary)
+    load_seconds = time.perf_counter() - start
+    word_count = len(index)
+    if freeze_index:
+        gc.freeze()
+
+    records = deque()
+    source = sys.stdin if args.boards == "-" else open(args.boards)
+    seconds = []
+    try:
+        boards = _read_boards(source, records)
+        results = solve_batch(boards, None, workers=args.workers or None,
+                              chunksize=args.chunk_size, index=index,
+                              timings=True, engine=args.engine)
+        for words, elapsed in results:
+            record = records.popleft()
+            if isinstance(record, dict):
+                if "error" not in record:
+                    record["words"] = words
+                output = record
+            else:
+                output = words
+            sys.stdout.write(json.dumps(output) + "\n")
+            seconds.append(elapsed)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if hasattr(index, "close"):
+            index.close()  # unmap a snapshot
+    sys.stdout.flush()
+
+    if args.stats:
+        total = time.perf_counter() - start - load_seconds
+        seconds.sort()
+        lines = [f"index loaded in {load_seconds:.3f}s ({word_count} words)",
+                 f"{len(seconds)} boards in {total:.3f}s"
+                 f" ({len(seconds) / total if total else 0:.1f} boards/s)"]
+        if seconds:
+            p99 = seconds[min(len(seconds) - 1, int(0.99 * len(seconds)))]
+            lines.append(f"solve time mean {sum(seconds) / len(seconds) * 1000:.2f}ms"
+                         f" p99 {p99 * 1000:.2f}ms")
+        peak = _peak_rss()
+        if peak is not None:
+            lines.append(f"peak memory {peak / (1024 * 1024):.1f} MiB")
+        print("\n".join(lines), file=sys.stderr)
+
 
 if __name__ == "__main__":
-    main()
+    main(freeze_index=True)
@@ -0,0 +1,143 @@
+from boggle_solver import Trie, TrieNode, gc_paused, letter_bit
+
+
+class Dawg:
+    """
+    Minimal directed acyclic word graph (DAWG) for word and prefix lookup
+
+    Built like a Trie, but equivalent suffix subtrees (same words below
+    them) are merged into a single shared node, so common endings such as
+    "-ing" or "-tion" are stored once. Nodes are TrieNode objects, so the
+    solver walks it the same way.
+
+    insert() and remove() are Trie's path-copying edits: a node reached by
+    several words is copied before it changes, so only the edited words
+    see the change. The graph is no longer minimal after edits.
+    """
+    def __init__(self):
+        self.root = TrieNode()
+        self.size = 0  # Number of distinct words stored
+        # Only nodes created by edits have a single parent and may change
+        self._owned = set()
+
+    fork = Trie.fork
+    _writable = Trie._writable
+    insert = Trie.insert
+    remove = Trie.remove
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Build a minimal DAWG from words in one incremental pass
+
+        Words are sorted and deduplicated first. Each new word only differs
+        from the previous one after their common prefix, so every node below
+        that point is final and can be merged with an equivalent registered
+        node (Daciuk et al., incremental construction from sorted data).
+
+        Args:
+            words: iterable of words
+
+        Returns:
+            A Dawg containing every word
+        """
+        dawg = cls()
+        register = {}
+        unchecked = []  # (parent, char, child) edges not yet minimized
+        previous = ""
+
+        def minimize(down_to):
+            while len(unchecked) > down_to:
+                parent, char, child = unchecked.pop()
+                key = (child.is_word,
+                       tuple((c, id(n)) for c, n in child.children.items()))
+                existing = register.get(key)
+                if existing is not None:
+                    parent.children[char] = existing
+                else:
+                    register[key] = child
+
+        with gc_paused():
+            for word in sorted(set(words)):
+                common = 0
+                for a, b in zip(word, previous):
+                    if a != b:
+                        break
+                    common += 1
+                minimize(common)
+
+                # Prefix nodes are still unregistered, so their heights can grow
+                for depth in range(common + 1):
+                    node = unchecked[depth - 1][2] if depth else dawg.root
+                    if node.longest < len(word) - depth:
+                        node.longest = len(word) - depth
+
+                for depth, char in enumerate(word[common:], common + 1):
+                    child = TrieNode()
+                    child.longest = len(word) - depth
+                    node.children[char] = child
+                    node.mask |= letter_bit(char)
+                    unchecked.append((node, char, child))
+                    node = child
+                node.is_word = True
+                dawg.size += 1
+                previous = word
+
+            minimize(0)
+        return dawg
+
+    def __len__(self):
+        return self.size
+
+    def step(self, node, chars):
+        """
+        Follow the child edges for chars starting at node
+
+        Args:
+            node: TrieNode to start from (self.root for the empty prefix)
+            chars: string of characters to consume (a whole tile, e.g. "qu")
+
+        Returns:
+            The TrieNode reached, or None if the prefix leaves the graph
+        """
+        for char in chars:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def is_word(self, node):
+        """Check if the prefix that reached node is a complete word"""
+        return node.is_word
+
+    def child_mask(self, node):
+        """Return the letter_bit() mask of the characters that can follow node"""
+        return node.mask
+
+    def max_remaining(self, node):
+        """Return how many more characters the longest word below node needs"""
+        return node.longest
+
+    def height(self):
+        """Return the length of the longest word in the graph"""
+        return self.root.longest
+
+    def search(self, word):
+        """Check if a word exists in the graph"""
+        node = self.step(self.root, word)
+        return node is not None and node.is_word
+
+    def starts_with(self, prefix):
+        """Check if any word in the graph starts with the given prefix"""
+        return self.step(self.root, prefix) is not None
+
+    def node_count(self):
+        """Return the number of distinct nodes, including the root"""
+        seen = {id(self.root)}
+        stack = [self.root]
+        while stack:
+            for child in stack.pop().children.values():
+                if id(child) not in seen:
+                    seen.add(id(child))
+                    stack.append(child)
+        return len(seen)
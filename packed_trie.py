@@ -0,0 +1,268 @@
+from array import array
+
+from boggle_solver import letter_bit
+
+
+class PackedTrie:
+    """
+    Trie stored in flat arrays instead of one object per node
+
+    Nodes are integer ids into four parallel tables. Each node's children
+    form a singly linked sibling list (first-child / next-sibling), so a
+    node costs a few machine words and no Python objects at all.
+    Node 0 is the root; -1 marks a missing link.
+    """
+    # Every node is reached by exactly one prefix
+    tree_shaped = True
+
+    def __init__(self):
+        self.labels = array('I', [0])          # Character code on the edge into each node
+        self.first_child = array('i', [-1])    # Id of each node's first child
+        self.next_sibling = array('i', [-1])   # Id of each node's next sibling
+        self.terminal = bytearray(1)           # 1 if node represents end of a word
+        self.masks = array('Q', [0])           # letter_bit() mask of each node's children
+        self.heights = array('H', [0])         # Longest word suffix below each node
+        self.counts = array('I', [0])          # Words ending at or below each node
+        self.root = 0
+        self.size = 0                          # Number of distinct words stored
+
+    @classmethod
+    def from_words(cls, words):
+        """
+        Build a packed trie containing every word in words in one pass
+
+        Like Trie.from_words: sorted input means only the nodes after the
+        prefix shared with the previous word are new, and node counts and
+        heights are summed up as nodes leave the previous word's path.
+        Nodes are laid out in depth-first order.
+        """
+        trie = cls()
+        labels = trie.labels
+        first_child = trie.first_child
+        next_sibling = trie.next_sibling
+        terminal = trie.terminal
+        masks = trie.masks
+        heights = trie.heights
+        counts = trie.counts
+        path = [0]
+        previous = ""
+
+        def close(depth):
+            while len(path) > depth + 1:
+                node = path.pop()
+                parent = path[-1]
+                counts[parent] += counts[node]
+                if heights[parent] < heights[node] + 1:
+                    heights[parent] = heights[node] + 1
+
+        for word in sorted(set(words)):
+            common = 0
+            for a, b in zip(word, previous):
+                if a != b:
+                    break
+                common += 1
+            close(common)
+            node = path[-1]
+            for char in word[common:]:
+                child = len(terminal)
+                labels.append(ord(char))
+                first_child.append(-1)
+                next_sibling.append(first_child[node])
+                terminal.append(0)
+                masks.append(0)
+                heights.append(0)
+                counts.append(0)
+                masks[node] |= letter_bit(char)
+                first_child[node] = child
+                path.append(child)
+                node = child
+            terminal[node] = 1
+            counts[node] = 1
+            trie.size += 1
+            previous = word
+        close(0)
+        return trie
+
+    def __len__(self):
+        return self.size
+
+    def _child(self, node, code):
+        """Return the child of node on edge code, or -1"""
+        labels = self.labels
+        next_sibling = self.next_sibling
+        child = self.first_child[node]
+        while child != -1 and labels[child] != code:
+            child = next_sibling[child]
+        return child
+
+    def fork(self):
+        """
+        Return a copy for private edits
+
+        The node tables are flat arrays, so copying them is a handful of
+        memory copies rather than a rebuild.
+        """
+        fork = type(self)()
+        fork.labels = array('I', self.labels)
+        fork.first_child = array('i', self.first_child)
+        fork.next_sibling = array('i', self.next_sibling)
+        fork.terminal = bytearray(self.terminal)
+        fork.masks = array('Q', self.masks)
+        fork.heights = array('H', self.heights)
+        fork.counts = array('I', self.counts)
+        fork.size = self.size
+        return fork
+
+    def insert(self, word):
+        """Insert a word into the trie"""
+        node = 0
+        for i, char in enumerate(word):
+            if self.heights[node] < len(word) - i:
+                self.heights[node] = len(word) - i
+            code = ord(char)
+            child = self._child(node, code)
+            if child == -1:
+                child = len(self.terminal)
+                self.labels.append(code)
+                self.first_child.append(-1)
+                self.next_sibling.append(self.first_child[node])
+                self.terminal.append(0)
+                self.masks.append(0)
+                self.heights.append(0)
+                self.counts.append(0)
+                self.masks[node] |= letter_bit(char)
+                self.first_child[node] = child
+            node = child
+        if not self.terminal[node]:
+            self.terminal[node] = 1
+            self.size += 1
+            self.counts[0] += 1
+            node = 0
+            for char in word:
+                node = self._child(node, ord(char))
+                self.counts[node] += 1
+
+    def remove(self, word):
+        """
+        Remove a word from the trie, unlinking nodes no word passes through
+
+        Unlinked nodes keep their slots in the tables, unused.
+
+        Args:
+            word: word to remove
+
+        Returns:
+            True if the word was stored and has been removed
+        """
+        path = [0]
+        for char in word:
+            child = self._child(path[-1], ord(char))
+            if child == -1:
+                return False
+            path.append(child)
+        if not self.terminal[path[-1]]:
+            return False
+        self.terminal[path[-1]] = 0
+        self.size -= 1
+        for node in path:
+            self.counts[node] -= 1
+
+        # Walk back up: unlink empty branches, then refresh mask and height
+        first_child = self.first_child
+        next_sibling = self.next_sibling
+        for depth in range(len(word), -1, -1):
+            node = path[depth]
+            if depth and self.counts[node] == 0:
+                parent = path[depth - 1]
+                if first_child[parent] == node:
+                    first_child[parent] = next_sibling[node]
+                else:
+                    sibling = first_child[parent]
+                    while next_sibling[sibling] != node:
+                        sibling = next_sibling[sibling]
+                    next_sibling[sibling] = next_sibling[node]
+                continue
+            mask = 0
+            height = 0
+            child = first_child[node]
+            while child != -1:
+                mask |= letter_bit(chr(self.labels[child]))
+                if height < self.heights[child] + 1:
+                    height = self.heights[child] + 1
+                child = next_sibling[child]
+            self.masks[node] = mask
+            self.heights[node] = height
+        return True
+
+    def step(self, node, chars):
+        """
+        Follow the child edges for chars starting at node
+
+        Args:
+            node: node id to start from (self.root for the empty prefix)
+            chars: string of characters to consume (a whole tile, e.g. "qu")
+
+        Returns:
+            The node id reached, or None if the prefix leaves the trie
+        """
+        labels = self.labels
+        next_sibling = self.next_sibling
+        first_child = self.first_child
+        for char in chars:
+            code = ord(char)
+            node = first_child[node]
+            while node != -1 and labels[node] != code:
+                node = next_sibling[node]
+            if node == -1:
+                return None
+        return node
+
+    def is_word(self, node):
+        """Check if the prefix that reached node is a complete word"""
+        return self.terminal[node] == 1
+
+    def child_mask(self, node):
+        """Return the letter_bit() mask of the characters that can follow node"""
+        return self.masks[node]
+
+    def max_remaining(self, node):
+        """Return how many more characters the longest word below node needs"""
+        return self.heights[node]
+
+    def height(self):
+        """Return the length of the longest word in the trie"""
+        return self.heights[0]
+
+    def word_count(self, node):
+        """Return the number of words ending at or below node"""
+        return self.counts[node]
+
+    def children(self, node):
+        """Yield (char, child) pairs of node's outgoing edges"""
+        child = self.first_child[node]
+        while child != -1:
+            yield chr(self.labels[child]), child
+            child = self.next_sibling[child]
+
+    def search(self, word):
+        """Check if a word exists in the trie"""
+        node = self.step(self.root, word)
+        return node is not None and self.terminal[node] == 1
+
+    def starts_with(self, prefix):
+        """Check if any word in the trie starts with the given prefix"""
+        return self.step(self.root, prefix) is not None
+
+    def node_count(self):
+        """Return the number of node slots, including the root and removed nodes"""
+        return len(self.terminal)
+
+    def nbytes(self):
+        """Return the size in bytes of the node tables"""
+        return (self.labels.itemsize * len(self.labels) +
+                self.first_child.itemsize * len(self.first_child) +
+                self.next_sibling.itemsize * len(self.next_sibling) +
+                len(self.terminal) +
+                self.masks.itemsize * len(self.masks) +
+                self.heights.itemsize * len(self.heights) +
+                self.counts.itemsize * len(self.counts))
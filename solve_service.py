@@ -0,0 +1,183 @@
+"""
+asyncio front-end for solving boards off the event loop
+
+A SolveService keeps one warm dictionary index and runs solves on a
+bounded thread or process executor, so coroutines can await solutions
+without blocking the loop:
+
+    async with SolveService(dictionary) as service:
+        words = await service.solve(grid)
+
+Identical in-flight boards (including rotations and reflections) share
+one computation, a solve nobody awaits any more is dropped before it
+starts, and requests beyond the concurrency limit plus queue depth are
+rejected with ServiceBusy.
+"""
+import asyncio
+import copy
+import gc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from boggle_solver import (Boggle, _init_worker, _pool_context, _solve_grid,
+                           canonical_grid)
+
+# Executors accepted by SolveService(executor=...)
+EXECUTORS = ("thread", "process")
+
+
+class ServiceBusy(RuntimeError):
+    """Raised by SolveService.solve when its queue is full"""
+
+
+def _solve_copy(template, grid):
+    """Executor task: solve grid with a shallow copy sharing the index"""
+    boggle = copy.copy(template)
+    boggle._setup_seconds = {}  # setGrid charges it; copies must not share it
+    boggle.setGrid(grid)
+    return boggle.getSolution()
+
+
+class SolveService:
+    """
+    Solves boards for asyncio code on a bounded executor
+
+    At most max_concurrency solves run at once and at most max_queue more
+    wait for a slot. Solves still waiting when every client awaiting them
+    was cancelled never start; a running solve cannot be interrupted, so
+    it keeps its slot until the executor finishes it and its result is
+    dropped.
+    """
+    def __init__(self, dictionary=None, index=None, max_concurrency=4,
+                 max_queue=64, executor="thread", freeze_index=False, **options):
+        """
+        Args:
+            dictionary: array of words (ignored when index is given)
+            index: optional prebuilt index, e.g. a memory-mapped snapshot
+            max_concurrency: number of solves running at once (and
+                executor threads/processes)
+            max_queue: number of further distinct boards allowed to wait
+            executor: "thread" (solvers share the index in this process)
+                or "process" (forked workers inherit the warm index)
+            freeze_index: move the warm index (and every other object
+                alive now) out of the garbage collector's reach with
+                gc.freeze(), so full collections do not rescan millions of
+                index nodes in the middle of requests; this affects the
+                whole process and is not undone by close(), so it is for
+                applications that own their process, e.g. a server
+            **options: extra Boggle options such as engine or index_class
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor {executor!r}, expected one of {EXECUTORS}")
+        if max_concurrency < 1 or max_queue < 0:
+            raise ValueError("max_concurrency must be >= 1 and max_queue >= 0")
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+
+        # Built once here, so no request pays for the index
+        self.boggle = Boggle([], None if index is not None else dictionary, **options)
+        if index is not None:
+            self.boggle.setIndex(index)
+        if freeze_index:
+            gc.collect()
+            gc.freeze()
+        if executor == "process":
+            self._executor = ProcessPoolExecutor(
+                max_concurrency, mp_context=_pool_context(),
+                initializer=_init_worker, initargs=(self.boggle,))
+            self._task = (_solve_grid,)
+        else:
+            self._executor = ThreadPoolExecutor(max_concurrency)
+            self._task = (_solve_copy, self.boggle)
+
+        self._slots = None      # asyncio.Semaphore, created on the loop
+        # canonical board -> [computation task, clients awaiting it,
+        # executor future once the solve started]
+        self._inflight = {}
+        self.pending = 0        # distinct boards queued or in the executor
+        self.solves = 0         # computations started
+        self.coalesced = 0      # requests answered by an in-flight computation
+        self.rejected = 0       # requests refused with ServiceBusy
+        self.dropped = 0        # computations cancelled before they started
+
+    async def solve(self, grid):
+        """
+        Returns the sorted solution of grid without blocking the loop
+
+        Args:
+            grid: 2D array of strings representing the game board
+
+        Returns:
+            Sorted list of found words, or empty list for invalid input
+
+        Raises:
+            ServiceBusy: if max_concurrency + max_queue boards are pending
+        """
+        grid = [[cell.lower() for cell in row] for row in grid or []]
+        # Like Boggle, answer empty and non-square boards with no words;
+        # canonical_grid would truncate them into some valid board's key
+        if not grid or any(len(row) != len(grid) for row in grid):
+            return []
+        key = canonical_grid(grid)
+        entry = self._inflight.get(key)
+        if entry is None:
+            if self.pending >= self.max_concurrency + self.max_queue:
+                self.rejected += 1
+                raise ServiceBusy(f"{self.pending} boards pending")
+            entry = self._inflight[key] = [None, 0, None]
+            self.pending += 1
+            entry[0] = asyncio.ensure_future(self._run(grid, entry))
+            entry[0].add_done_callback(lambda _: self._finish(key, entry))
+        else:
+            self.coalesced += 1
+
+        task = entry[0]
+        entry[1] += 1
+        try:
+            # shield: one client going away must not cancel the others
+            return list(await asyncio.shield(task))
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not task.done():
+                # Later requests for this board must start afresh, not
+                # join a computation that is being cancelled
+                if self._inflight.get(key) is entry:
+                    del self._inflight[key]
+                task.cancel()
+
+    def _finish(self, key, entry):
+        if entry[2] is None:
+            self.pending -= 1  # never reached the executor, see _release
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+    async def _run(self, grid, entry):
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        try:
+            await self._slots.acquire()
+        except asyncio.CancelledError:
+            self.dropped += 1
+            raise
+        self.solves += 1
+        loop = asyncio.get_running_loop()
+        future = entry[2] = loop.run_in_executor(self._executor, *self._task, grid)
+        future.add_done_callback(self._release)
+        # shield: a running solve cannot be interrupted, so cancelling this
+        # task must not free its slot while the executor is still busy
+        return await asyncio.shield(future)
+
+    def _release(self, future):
+        if not future.cancelled():
+            future.exception()  # retrieved, so an abandoned failure is not logged
+        self._slots.release()
+        self.pending -= 1
+
+    def close(self):
+        """Shuts the executor down, waiting for running solves"""
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
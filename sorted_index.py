@@ -0,0 +1,132 @@
+"""
+Dictionary index over a sorted word array
+
+The words are kept as one sorted, deduplicated list and every lookup is
+a binary search (bisect) into it, so there are no nodes to build. A
+node is the current prefix with the range of words that start with it;
+stepping narrows the range. A list that is already sorted can be loaded
+from a file without sorting it again.
+"""
+from bisect import bisect_left, insort
+
+from boggle_solver import iter_words_from_file
+
+# Sorts after every character, so prefix + _LAST bounds words with prefix
+_LAST = chr(0x10FFFF)
+
+
+class SortedIndex:
+    """
+    Dictionary index answering prefix and word queries with bisect
+
+    Nodes are (prefix, lo, hi) tuples: words[lo:hi] are exactly the words
+    that start with prefix. Lookups cost O(log n) string comparisons per
+    step instead of one dict lookup, in exchange for no build time and
+    one list of strings as the only storage.
+    """
+    def __init__(self, words=()):
+        """
+        Args:
+            words: sorted list of distinct words, used as is
+        """
+        self.words = words if isinstance(words, list) else list(words)
+        self.root = ("", 0, len(self.words))
+
+    @classmethod
+    def from_words(cls, words):
+        """Build an index containing every word in words"""
+        return cls(sorted(set(words)))
+
+    @classmethod
+    def from_sorted_file(cls, filename):
+        """
+        Load an index from a word list file that is already sorted
+
+        Words are filtered like Boggle.setDictionary while streaming; the
+        order is checked, not sorted, and repeats of the previous word
+        are skipped, so no set of seen words is needed.
+
+        Args:
+            filename: path to a sorted word list (plain, gzip or bz2)
+
+        Returns:
+            A SortedIndex over the file's words
+
+        Raises:
+            ValueError: if the filtered words are not in sorted order
+        """
+        words = []
+        previous = ""
+        for word in iter_words_from_file(filename):
+            if not word.isalpha() or len(word) < 3:
+                continue
+            word = word.lower()
+            if word <= previous:
+                if word == previous:
+                    continue
+                raise ValueError(f"{filename} is not sorted: {word!r} follows {previous!r}")
+            words.append(word)
+            previous = word
+        return cls(words)
+
+    def fork(self):
+        """Return a copy for private edits; only the word list is copied"""
+        return type(self)(list(self.words))
+
+    def insert(self, word):
+        """Insert a word, keeping the list sorted"""
+        if not self.search(word):
+            insort(self.words, word)
+            self.root = ("", 0, len(self.words))
+
+    def remove(self, word):
+        """
+        Remove a word
+
+        Returns:
+            True if the word was stored and has been removed
+        """
+        if not self.search(word):
+            return False
+        del self.words[bisect_left(self.words, word)]
+        self.root = ("", 0, len(self.words))
+        return True
+
+    def __len__(self):
+        return len(self.words)
+
+    def step(self, node, chars):
+        """
+        Narrow node's word range to the words continuing with chars
+
+        Args:
+            node: (prefix, lo, hi) node (self.root for the empty prefix)
+            chars: string of characters to consume (a whole tile, e.g. "qu")
+
+        Returns:
+            The (prefix, lo, hi) node reached, or None if no word has
+            that prefix
+        """
+        prefix, lo, hi = node
+        prefix += chars
+        words = self.words
+        lo = bisect_left(words, prefix, lo, hi)
+        hi = bisect_left(words, prefix + _LAST, lo, hi)
+        if lo == hi:
+            return None
+        return prefix, lo, hi
+
+    def is_word(self, node):
+        """Check if the prefix that reached node is a complete word"""
+        # The prefix itself sorts first among the words it starts
+        return self.words[node[1]] == node[0]
+
+    def search(self, word):
+        """Check if a word exists in the index"""
+        i = bisect_left(self.words, word)
+        return i < len(self.words) and self.words[i] == word
+
+    def starts_with(self, prefix):
+        """Check if any word in the index starts with the given prefix"""
+        i = bisect_left(self.words, prefix)
+        return i < len(self.words) and self.words[i].startswith(prefix)
@@ -0,0 +1,74 @@
+import unittest
+from boggle_solver import Boggle, filter_words
+import board_filter
+from board_filter import WordFilter, board_bigrams, board_letters
+from test_boggle_solver import random_grid, random_words
+
+
+class TestBoardFilter(unittest.TestCase):
+    """Pre-filtering must only drop words the board cannot form"""
+
+    def setUp(self):
+        self.grid = [["t", "w", "y", "r"],
+                     ["e", "n", "p", "h"],
+                     ["g", "st", "qu", "r"],
+                     ["o", "n", "t", "a"]]
+
+    def test_board_letters_split_multi_letter_tiles(self):
+        """Tile letters are counted individually"""
+        letters = board_letters(self.grid)
+        self.assertEqual(letters["t"], 3)
+        self.assertEqual(letters["q"], 1)
+        self.assertEqual(letters["u"], 1)
+
+    def test_board_bigrams(self):
+        """Pairs come from inside tiles and across adjacent tiles only"""
+        bigrams = board_bigrams(self.grid)
+        self.assertIn("qu", bigrams)   # inside the Qu tile
+        self.assertIn("st", bigrams)   # inside the St tile
+        self.assertIn("ua", bigrams)   # Qu -> A is diagonal
+        self.assertIn("tn", bigrams)   # St -> N
+        self.assertNotIn("wa", bigrams)
+        self.assertNotIn("ya", bigrams)
+        self.assertIsNone(board_bigrams([["a", ""], ["b", "c"]]))
+
+    def test_rejects_impossible_words(self):
+        """Missing letters, too many copies and absent pairs are rejected"""
+        words = ["art", "quart", "tarp", "zoo", "ttttt", "tyr", "aqua"]
+        for use_numpy in self.modes():
+            feasible = WordFilter(words, use_numpy).feasible(self.grid)
+            self.assertEqual(feasible, ["art", "quart", "tarp"], use_numpy)
+
+    def test_empty_word_list(self):
+        """An empty word list builds and keeps no words on either path"""
+        for use_numpy in self.modes():
+            self.assertEqual(WordFilter([], use_numpy).feasible(self.grid), [], use_numpy)
+
+    def test_numpy_and_python_paths_agree(self):
+        """Both filter implementations keep the same words"""
+        if board_filter.np is None:
+            self.skipTest("NumPy not installed")
+        words = filter_words(random_words(5000, seed=9))
+        numpy_filter = WordFilter(words, use_numpy=True)
+        python_filter = WordFilter(words, use_numpy=False)
+        for seed in range(4):
+            grid = random_grid(4, seed)
+            self.assertEqual(numpy_filter.feasible(grid), python_filter.feasible(grid))
+
+    def test_prefiltered_solve_matches_default(self):
+        """Boggle(prefilter=True) finds exactly the same words"""
+        dictionary = random_words(5000, seed=9) + ["quest", "stone", "tie"]
+        for seed in range(4):
+            grid = random_grid(5, seed)
+            expected = Boggle(grid, dictionary).getSolution()
+            for engine in ("recursive", "bitmask"):
+                boggle = Boggle(grid, dictionary, engine=engine, prefilter=True)
+                self.assertEqual(boggle.getSolution(), expected)
+                self.assertEqual(sorted(boggle.iterSolution()), expected)
+
+    def modes(self):
+        return [False] if board_filter.np is None else [False, True]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,73 @@
+import bz2
+import contextlib
+import gc
+import gzip
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import threading
 import unittest
-from boggle_solver import Boggle
+from boggle_solver import (Boggle, Trie, neighbor_table, solve_batch,
+                           TrieNode, gc_paused,
+                           clear_index_cache, index_cache_info,
+                           canonical_grid, SolutionCache,
+                           iter_words_from_file, read_words_from_file,
+                           iter_dictionary, main)
+
+
+TILES = ["a", "b", "c", "d", "e", "e", "i", "l", "n", "o", "r", "s", "t",
+         "u", "qu", "st", "ie"]
+
+
+def random_grid(n, seed):
+    """Seeded random NxN grid drawn from TILES"""
+    rng = random.Random(seed)
+    return [[rng.choice(TILES) for _ in range(n)] for _ in range(n)]
+
+
+def random_words(count, seed, alphabet="abcdeilnorstu"):
+    """Seeded random word list with lengths between 3 and 8"""
+    rng = random.Random(seed)
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(3, 8)))
+            for _ in range(count)]
+
+
+def engine_grids():
+    """Seeded grids from 1x1 to 8x8, plus one with empty and multi-letter tiles"""
+    grids = [random_grid(n, seed) for n, seed in [(1, 0), (2, 5), (4, 1), (6, 2), (8, 3)]]
+    grids.append([["t", "", "e"], ["s", "qu", "i"], ["", "st", "o"]])
+    return grids
+
+
+def reference_solution(grid, dictionary):
+    """Brute-force solver that re-walks the trie from the root every step"""
+    trie = Trie()
+    words = [w.lower() for w in dictionary if w.isalpha() and len(w) >= 3]
+    for word in words:
+        trie.insert(word)
+    n = len(grid)
+    found = set()
+
+    def dfs(row, col, word, visited):
+        word += grid[row][col]
+        if not trie.starts_with(word):
+            return
+        if len(word) >= 3 and trie.search(word):
+            found.add(word)
+        visited.add((row, col))
+        for r in range(row - 1, row + 2):
+            for c in range(col - 1, col + 2):
+                if 0 <= r < n and 0 <= c < n and (r, c) not in visited:
+                    dfs(r, c, word, visited)
+        visited.remove((row, col))
+
+    for row in range(n):
+        for col in range(n):
+            dfs(row, col, "", set())
+    return sorted(found)
 
 
 class TestBoggleSolver(unittest.TestCase):
@@ -387,6 +455,728 @@ class TestBoggleSolver(unittest.TestCase):
         for word in invalid_words:
             self.assertNotIn(word, result, f"Invalid word '{word}' should NOT be found")
 
+    # ========== TRIE CURSOR ==========
+
+    def test_trie_step_consumes_whole_tile(self):
+        """TRIE: step() follows every character of a multi-letter tile"""
+        trie = Trie()
+        trie.insert("quart")
+        node = trie.step(trie.root, "qu")
+        self.assertIsNotNone(node)
+        self.assertFalse(trie.is_word(node))
+        node = trie.step(node, "art")
+        self.assertTrue(trie.is_word(node))
+        self.assertIsNone(trie.step(trie.root, "qa"))
+
+    def test_bulk_build_matches_repeated_insert(self):
+        """TRIE: from_words builds the same nodes and counters as insert()"""
+        words = random_words(2000, seed=5) + ["art", "art", "artist", "arts"]
+        built = Trie.from_words(words)
+        inserted = Trie()
+        for word in words:
+            inserted.insert(word)
+        self.assertEqual(len(built), len(inserted))
+
+        def shape(node):
+            return (node.is_word, node.mask, node.longest, node.count,
+                    {char: shape(child) for char, child in node.children.items()})
+        self.assertEqual(shape(built.root), shape(inserted.root))
+
+    def test_gc_paused_collects_young_objects_before_resuming(self):
+        """TRIE: Nodes made while collection is paused are not left to a later collection"""
+        if not gc.isenabled():
+            self.skipTest("garbage collection is disabled")
+        with gc_paused():
+            self.assertFalse(gc.isenabled())
+            nodes = [TrieNode() for _ in range(5000)]
+        self.assertTrue(gc.isenabled())
+        self.assertLess(gc.get_count()[0], 100)
+        self.assertEqual(gc.get_count()[1], 0)
+        self.assertEqual(len(nodes), 5000)
+
+    def test_matches_reference_solver_on_random_boards(self):
+        """CORRECTNESS: Cursor DFS returns the same words as a root-walking search"""
+        dictionary = random_words(3000, seed=7) + ["quest", "stone", "tie", "lie"]
+        for seed in range(5):
+            grid = random_grid(5, seed)
+            boggle = Boggle(grid, dictionary)
+            self.assertEqual(boggle.getSolution(),
+                             reference_solution(grid, dictionary))
+
+    # ========== BITMASK ENGINE ==========
+
+    def test_neighbor_table(self):
+        """BITMASK: Neighbor tables list 8-way neighbors and are cached by size"""
+        table = neighbor_table(3)
+        self.assertEqual(sorted(table[4]), [0, 1, 2, 3, 5, 6, 7, 8])
+        self.assertEqual(sorted(table[0]), [1, 3, 4])
+        self.assertEqual(sorted(table[8]), [4, 5, 7])
+        self.assertIs(neighbor_table(3), table)
+
+    def test_engines_match_recursive(self):
+        """ENGINES: Every engine returns the default engine's words on every index"""
+        from dawg import Dawg
+        from packed_trie import PackedTrie
+        dictionary = random_words(3000, seed=7) + ["quest", "stone", "tie", "ties"]
+        for grid in engine_grids():
+            expected = Boggle(grid, dictionary).getSolution()
+            for engine in ("bitmask", "masked", "pruned", "iterative"):
+                for index_class in (Trie, PackedTrie, Dawg):
+                    with self.subTest(n=len(grid), engine=engine, index=index_class.__name__):
+                        boggle = Boggle(grid, dictionary, index_class=index_class,
+                                        engine=engine)
+                        self.assertEqual(boggle.getSolution(), expected)
+                        self.assertEqual(sorted(boggle.solution), expected)
+                        self.assertEqual(boggle.getSolution(min_word_length=5),
+                                         [w for w in expected if len(w) >= 5])
+
+    def test_child_mask(self):
+        """MASKED: child_mask() has a bit for every child edge"""
+        from boggle_solver import letter_bit
+        trie = Trie.from_words(["art", "ant", "quit"])
+        self.assertEqual(trie.child_mask(trie.root), letter_bit("a") | letter_bit("q"))
+        self.assertEqual(trie.child_mask(trie.step(trie.root, "a")),
+                         letter_bit("r") | letter_bit("n"))
+        self.assertEqual(trie.child_mask(trie.step(trie.root, "art")), 0)
+
+    def test_unknown_engine_rejected(self):
+        """BITMASK: Unknown engine names raise ValueError"""
+        with self.assertRaises(ValueError):
+            Boggle([["A"]], ["abc"], engine="magic")
+
+    # ========== PARALLEL SOLVE ==========
+
+    def test_parallel_solve_matches_serial(self):
+        """PARALLEL: Splitting start cells over processes gives the same words"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        expected = Boggle(grid, dictionary).getSolution()
+        for engine in ("recursive", "bitmask"):
+            boggle = Boggle(grid, dictionary, engine=engine, workers=2)
+            self.assertEqual(boggle.getSolution(), expected)
+            self.assertEqual(sorted(boggle.solution), expected)
+
+    def test_process_pool_searches_the_grid_snapshot(self):
+        """PARALLEL: Worker processes search the grid the solve started with"""
+        from boggle_solver import word_bounds
+        dictionary = random_words(3000, seed=7)
+        grid, other = random_grid(5, 1), random_grid(5, 2)
+        boggle = Boggle(other, dictionary, engine="bitmask", workers=2)
+        solution = set()
+        boggle._search_parallel([[tile for tile in row] for row in grid], 2,
+                                boggle.trie, word_bounds(), solution)
+        self.assertEqual(sorted(solution), Boggle(grid, dictionary).getSolution())
+
+    def test_thread_pool_solve_matches_serial(self):
+        """PARALLEL: Splitting start cells over threads gives the same words"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        expected = Boggle(grid, dictionary).getSolution()
+        for engine in ("recursive", "masked", "pruned", "iterative"):
+            boggle = Boggle(grid, dictionary, engine=engine, workers=3, pool="thread")
+            self.assertEqual(boggle.getSolution(), expected, engine)
+        with self.assertRaises(ValueError):
+            Boggle(grid, dictionary, pool="fiber")
+
+    def test_shared_solver_is_reentrant_across_threads(self):
+        """PARALLEL: Threads calling getSolution on one solver all get full results"""
+        from concurrent.futures import ThreadPoolExecutor
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        # Switch threads often so unsafe shared state would be caught
+        self.addCleanup(sys.setswitchinterval, sys.getswitchinterval())
+        sys.setswitchinterval(1e-6)
+        for engine in ("recursive", "bitmask", "pruned"):
+            boggle = Boggle(grid, dictionary, engine=engine)
+            expected = boggle.getSolution()
+            with ThreadPoolExecutor(8) as executor:
+                results = list(executor.map(lambda _: boggle.getSolution(), range(32)))
+            for result in results:
+                self.assertEqual(result, expected, engine)
+            self.assertEqual(sorted(boggle.solution), expected)
+
+    # ========== BATCH SOLVE ==========
+
+    def test_solve_batch_matches_individual_solves(self):
+        """BATCH: Batch solutions match per-board solves, in input order"""
+        dictionary = random_words(3000, seed=7)
+        grids = [random_grid(4, seed) for seed in range(12)] + [[], [["A", "B"]]]
+        expected = [Boggle(grid, dictionary).getSolution() for grid in grids]
+        self.assertEqual(list(solve_batch(grids, dictionary)), expected)
+        self.assertEqual(list(solve_batch(iter(grids), dictionary, workers=2,
+                                          chunksize=3, engine="bitmask")),
+                         expected)
+
+    def test_solve_batch_reads_only_a_window_ahead(self):
+        """BATCH: Workers read at most workers * in_flight chunks ahead of the output"""
+        dictionary = random_words(3000, seed=7)
+        read = []
+
+        def boards():
+            for seed in range(1000):
+                read.append(seed)
+                yield random_grid(4, seed)
+
+        results = solve_batch(boards(), dictionary, workers=2, chunksize=3, in_flight=2)
+        first = next(results)
+        self.assertEqual(len(read), 2 * 2 * 3)
+        next(results)
+        next(results)  # the first chunk is drained, but not yet refilled
+        self.assertEqual(len(read), 2 * 2 * 3)
+        next(results)
+        self.assertEqual(len(read), 2 * 2 * 3 + 3)
+        results.close()
+        self.assertEqual(first, Boggle(random_grid(4, 0), dictionary).getSolution())
+
+    def test_solve_batch_with_prebuilt_index(self):
+        """BATCH: A prebuilt index is used instead of the dictionary"""
+        grid = [["A", "R", "T"], ["E", "G", "O"], ["N", "E", "T"]]
+        index = Trie.from_words(["art", "net", "ego"])
+        self.assertEqual(list(solve_batch([grid], None, index=index)),
+                         [["art", "ego", "net"]])
+
+    # ========== SHARED INDEX CACHE ==========
+
+    def test_identical_dictionaries_share_one_index(self):
+        """INDEX CACHE: Equal filtered word lists reuse the built index"""
+        clear_index_cache()
+        first = Boggle([["A"]], ["ART", "rat", "x"])
+        second = Boggle([["B"]], ["art", "RAT"])
+        self.assertIs(first.trie, second.trie)
+        third = Boggle([["B"]], ["art", "tar"])
+        self.assertIsNot(first.trie, third.trie)
+        info = index_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 2, 2))
+
+    def test_index_cache_is_per_index_class(self):
+        """INDEX CACHE: Different index classes never share an entry"""
+        from packed_trie import PackedTrie
+        clear_index_cache()
+        trie = Boggle([], ["art"]).trie
+        packed = Boggle([], ["art"], index_class=PackedTrie).trie
+        self.assertIsInstance(trie, Trie)
+        self.assertIsInstance(packed, PackedTrie)
+
+    def test_index_cache_tells_same_named_classes_apart(self):
+        """INDEX CACHE: Classes sharing a name are keyed by identity"""
+        from packed_trie import PackedTrie
+        clear_index_cache()
+        indexes = []
+        for base in (Trie, PackedTrie):
+            class Index(base):
+                pass
+            indexes.append(Boggle([], ["art"], index_class=Index).trie)
+        self.assertIsInstance(indexes[0], Trie)
+        self.assertIsInstance(indexes[1], PackedTrie)
+
+    def test_index_cache_evicts_least_recently_used(self):
+        """INDEX CACHE: The cache holds at most maxsize indexes"""
+        clear_index_cache(maxsize=2)
+        try:
+            a = Boggle([], ["aaa"]).trie
+            Boggle([], ["bbb"])
+            Boggle([], ["aaa"])  # refresh "aaa"
+            Boggle([], ["ccc"])  # evicts "bbb"
+            self.assertIs(Boggle([], ["aaa"]).trie, a)
+            self.assertEqual(index_cache_info().currsize, 2)
+            Boggle([], ["bbb"])
+            self.assertEqual(index_cache_info().misses, 4)
+        finally:
+            clear_index_cache(maxsize=8)
+
+    # ========== SOLUTION CACHE ==========
+
+    def test_canonical_grid_folds_symmetries(self):
+        """SOLUTION CACHE: All 8 rotations/reflections share a canonical form"""
+        grid = [["a", "b", "c"], ["d", "e", "f"], ["g", "h", "qu"]]
+        rotated = [list(row) for row in zip(*grid[::-1])]
+        mirrored = [row[::-1] for row in grid]
+        transposed = [list(row) for row in zip(*grid)]
+        for other in (rotated, mirrored, transposed):
+            self.assertEqual(canonical_grid(other), canonical_grid(grid))
+        self.assertNotEqual(canonical_grid([["b", "a"], ["c", "d"]]),
+                            canonical_grid([["a", "b"], ["c", "e"]]))
+
+    def test_rotated_board_hits_cache(self):
+        """SOLUTION CACHE: A rotated repeat board is answered from the cache"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(5, 2)
+        rotated = [list(row) for row in zip(*grid[::-1])]
+        cache = SolutionCache(capacity=4)
+        expected = Boggle(grid, dictionary).getSolution()
+        boggle = Boggle(grid, dictionary, solution_cache=cache)
+        self.assertEqual(boggle.getSolution(), expected)
+        boggle.setGrid(rotated)
+        self.assertEqual(boggle.getSolution(), expected)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate(), 0.5)
+
+    def test_solution_cache_is_keyed_by_dictionary(self):
+        """SOLUTION CACHE: Different dictionaries never share cached solutions"""
+        cache = SolutionCache()
+        grid = [["A", "R", "T"], ["E", "G", "O"], ["N", "E", "T"]]
+        self.assertEqual(Boggle(grid, ["art"], solution_cache=cache).getSolution(), ["art"])
+        self.assertEqual(Boggle(grid, ["net"], solution_cache=cache).getSolution(), ["net"])
+        self.assertEqual(cache.hits, 0)
+
+    def test_solution_cache_capacity(self):
+        """SOLUTION CACHE: The cache holds at most capacity boards"""
+        cache = SolutionCache(capacity=2)
+        boggle = Boggle([], ["art"], solution_cache=cache)
+        for seed in range(4):
+            boggle.setGrid(random_grid(3, seed))
+            boggle.getSolution()
+        self.assertEqual(cache.info().currsize, 2)
+
+    # ========== STREAMING SOLVE ==========
+
+    def test_iter_solution_yields_every_word_once(self):
+        """STREAMING: iterSolution yields exactly the getSolution words"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(5, 1)
+        boggle = Boggle(grid, dictionary)
+        words = list(boggle.iterSolution())
+        self.assertEqual(len(words), len(set(words)))
+        self.assertEqual(sorted(words), boggle.getSolution())
+
+    def test_iter_solution_max_words(self):
+        """STREAMING: iterSolution stops after max_words words"""
+        boggle = Boggle(random_grid(5, 1), random_words(3000, seed=7))
+        words = list(boggle.iterSolution(max_words=3))
+        self.assertEqual(len(words), 3)
+        self.assertEqual(boggle.solution, set(words))
+        self.assertEqual(list(boggle.iterSolution(max_words=0)), [])
+
+    def test_iter_solution_time_budget(self):
+        """STREAMING: An exhausted time budget ends the stream early"""
+        boggle = Boggle(random_grid(12, 1), random_words(3000, seed=7))
+        self.assertEqual(list(boggle.iterSolution(time_budget=0)), [])
+
+    def test_iter_solution_invalid_input(self):
+        """STREAMING: Invalid grids and empty dictionaries yield nothing"""
+        self.assertEqual(list(Boggle([["A", "B"], ["C"]], ["abc"]).iterSolution()), [])
+        self.assertEqual(list(Boggle([["A"]], None).iterSolution()), [])
+
+    # ========== PRUNED ENGINE ==========
+
+    def test_pruned_engine_stops_when_dictionary_exhausted(self):
+        """PRUNED: Once every word is found no further cells are explored"""
+        class CountingTrie(Trie):
+            steps = 0
+
+            def step(self, node, chars):
+                CountingTrie.steps += 1
+                return Trie.step(self, node, chars)
+
+        grid = [["A"] * 4 for _ in range(4)]  # every path spells a word
+        calls = {}
+        for engine in ("masked", "pruned"):
+            CountingTrie.steps = 0
+            boggle = Boggle(grid, ["aaa", "aaaa"], index_class=CountingTrie,
+                            engine=engine)
+            self.assertEqual(boggle.getSolution(), ["aaa", "aaaa"])
+            calls[engine] = CountingTrie.steps
+        self.assertLess(calls["pruned"] * 100, calls["masked"])
+
+    # ========== ITERATIVE ENGINE ==========
+
+    def test_iterative_engine_ignores_recursion_limit(self):
+        """ITERATIVE: Paths longer than the recursion limit are still found"""
+        import sys
+        n = 40
+        # Distinct letters snaking row by row, so exactly one long path exists
+        letters = [[chr(0x4E00 + row * n + col) for col in range(n)] for row in range(n)]
+        snake = [letters[row][col]
+                 for row in range(n)
+                 for col in (range(n) if row % 2 == 0 else reversed(range(n)))]
+        word = "".join(snake[:sys.getrecursionlimit() + 200])
+        boggle = Boggle(letters, [word, "".join(snake[:3])], engine="iterative")
+        self.assertEqual(boggle.getSolution(), sorted([word, "".join(snake[:3])]))
+
+    # ========== INCREMENTAL UPDATES ==========
+
+    def test_update_grid_matches_full_solve(self):
+        """INCREMENTAL: Every edit sequence gives the same words as a full solve"""
+        from packed_trie import PackedTrie
+        from sorted_index import SortedIndex
+        dictionary = random_words(3000, seed=7) + ["quest", "stone", "tie", "ties"]
+        for index_class in (Trie, PackedTrie, SortedIndex):
+            with self.subTest(index_class=index_class.__name__):
+                rng = random.Random(3)
+                grid = random_grid(8, 6)
+                boggle = Boggle(grid, dictionary, index_class=index_class)
+                self.assertEqual(boggle.updateGrid([]), Boggle(grid, dictionary).getSolution())
+                for _ in range(30):
+                    changes = [(rng.randrange(8), rng.randrange(8), rng.choice(TILES + [""]))
+                               for _ in range(rng.randint(1, 3))]
+                    for row, col, tile in changes:
+                        grid[row][col] = tile
+                    result = boggle.updateGrid(changes)
+                    self.assertEqual(result, Boggle(grid, dictionary).getSolution(), changes)
+                    self.assertEqual(boggle.solution, set(result))
+
+    def test_update_grid_reuses_unaffected_words(self):
+        """INCREMENTAL: Editing a far corner keeps words found elsewhere"""
+        grid = [["A", "R", "T", "X"],
+                ["E", "G", "O", "X"],
+                ["N", "E", "T", "X"],
+                ["X", "X", "X", "X"]]
+        boggle = Boggle(grid, ["art", "ego", "net", "xxxxy"])
+        self.assertEqual(boggle.updateGrid([]), ["art", "ego", "net"])
+        self.assertEqual(boggle.updateGrid([(3, 3, "Y")]), ["art", "ego", "net", "xxxxy"])
+        self.assertEqual(boggle.updateGrid([(0, 0, "O")]), ["ego", "net", "xxxxy"])
+
+    def test_update_grid_keeps_words_still_spelled_by_their_path(self):
+        """INCREMENTAL: A word whose path still spells it after an edit is kept"""
+        grid = [["A", "R", "T"],
+                ["E", "G", "O"],
+                ["N", "E", "T"]]
+        boggle = Boggle(grid, ["art", "ego", "net", "ten"])
+        self.assertEqual(boggle.updateGrid([]), ["art", "ego", "net", "ten"])
+        self.assertEqual(boggle.updateGrid([(1, 1, "G"), (0, 0, "a")]),
+                         ["art", "ego", "net", "ten"])
+        self.assertEqual(boggle.updateGrid([(1, 1, "X")]), ["art", "net", "ten"])
+        self.assertEqual(boggle.updateGrid([(1, 1, "G")]), ["art", "ego", "net", "ten"])
+
+    def test_update_grid_rejects_cells_outside_grid(self):
+        """INCREMENTAL: Out-of-range edits raise ValueError"""
+        boggle = Boggle([["A", "B"], ["C", "D"]], ["abc"])
+        with self.assertRaises(ValueError):
+            boggle.updateGrid([(2, 0, "E")])
+
+    # ========== DICTIONARY EDITS ==========
+
+    def test_add_and_remove_words_match_rebuilt_dictionary(self):
+        """DICTIONARY EDITS: Edits give the same solution as a fresh dictionary"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        boggle = Boggle(grid, dictionary)
+        found = boggle.getSolution()
+        self.assertEqual(boggle.removeWords(found[::2] + ["zzz", "ab"]), len(found[::2]))
+        self.assertEqual(boggle.addWords(["Quest", "stone", "stone", "art"]), 3)
+        current = [w for w in dictionary if w not in set(found[::2])] + ["quest", "stone", "art"]
+        self.assertEqual(boggle.getSolution(), Boggle(grid, current).getSolution())
+        self.assertEqual(len(boggle.trie), len(set(current)))
+
+    def test_remove_words_prunes_nodes_and_heights(self):
+        """DICTIONARY EDITS: Removing a word drops its unused nodes and height"""
+        trie = Trie.from_words(["art", "artist", "bee"])
+        self.assertTrue(trie.remove("artist"))
+        self.assertFalse(trie.remove("artist"))
+        self.assertFalse(trie.remove("ar"))
+        node = trie.step(trie.root, "art")
+        self.assertEqual((node.children, node.count, node.longest), ({}, 1, 0))
+        self.assertEqual(trie.height(), 3)
+        trie.remove("bee")
+        self.assertNotIn("b", trie.root.children)
+        self.assertEqual(trie.root.mask, Trie.from_words(["art"]).root.mask)
+
+    def test_dictionary_edits_leave_shared_index_untouched(self):
+        """DICTIONARY EDITS: Other solvers sharing the cached index are unaffected"""
+        clear_index_cache()
+        grid = [["A", "R", "T"], ["E", "G", "O"], ["N", "E", "T"]]
+        first = Boggle(grid, ["art", "ego"])
+        second = Boggle(grid, ["art", "ego"])
+        first.removeWords(["art"])
+        first.addWords(["net"])
+        self.assertEqual(first.getSolution(), ["ego", "net"])
+        self.assertEqual(second.getSolution(), ["art", "ego"])
+
+    def test_dictionary_edits_carry_over_cached_solutions(self):
+        """DICTIONARY EDITS: Only solutions an edit affects are invalidated"""
+        cache = SolutionCache()
+        art = [["A", "R", "T"], ["E", "G", "O"], ["N", "E", "T"]]
+        bee = [["B", "E", "E"], ["X", "X", "X"], ["X", "X", "X"]]
+        boggle = Boggle(art, ["art", "ego", "bee"], solution_cache=cache)
+        boggle.getSolution()
+        boggle.setGrid(bee)
+        boggle.getSolution()
+        boggle.removeWords(["ego"])
+        boggle.addWords(["xxx"])
+        hits = cache.hits
+        self.assertEqual(boggle.getSolution(), ["bee", "xxx"])  # recomputed
+        boggle.setGrid(art)
+        self.assertEqual(boggle.getSolution(), ["art"])  # carried over
+        self.assertEqual(cache.hits, hits + 1)
+
+    def test_fork_copies_only_edited_paths(self):
+        """DICTIONARY EDITS: A fork shares untouched nodes and leaves the original alone"""
+        trie = Trie.from_words(["art", "arts", "bee", "bees"])
+        fork = trie.fork()
+        fork.insert("artist")
+        fork.remove("bees")
+        self.assertIs(fork.root.children["a"].children["r"].children["t"].children["s"],
+                      trie.root.children["a"].children["r"].children["t"].children["s"])
+        self.assertIsNot(fork.root.children["a"], trie.root.children["a"])
+        self.assertEqual([w for w in ["art", "arts", "artist", "bee", "bees"] if fork.search(w)],
+                         ["art", "arts", "artist", "bee"])
+        self.assertEqual([w for w in ["art", "arts", "artist", "bee", "bees"] if trie.search(w)],
+                         ["art", "arts", "bee", "bees"])
+        self.assertEqual((len(trie), trie.height(), trie.root.count), (4, 4, 4))
+
+    def test_dictionary_edits_never_rebuild(self):
+        """DICTIONARY EDITS: Every index edits a fork instead of calling from_words"""
+        from dawg import Dawg
+        from packed_trie import PackedTrie
+        from sorted_index import SortedIndex
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        removed = Boggle(grid, dictionary).getSolution()[::2]
+        current = [w for w in dictionary if w not in set(removed)] + ["quest", "stone"]
+        expected = Boggle(grid, current).getSolution()
+        for index_class in (Trie, PackedTrie, Dawg, SortedIndex):
+            clear_index_cache()  # each NoRebuild is a new class; start uncached
+
+            class NoRebuild(index_class):
+                built = False
+
+                @classmethod
+                def from_words(cls, words):
+                    if NoRebuild.built:
+                        raise AssertionError("index rebuilt")
+                    NoRebuild.built = True
+                    return super().from_words(words)
+
+            boggle = Boggle(grid, dictionary, index_class=NoRebuild)
+            shared = boggle.trie
+            before = boggle.getSolution()
+            boggle.removeWords(removed)
+            boggle.addWords(["quest", "stone"])
+            self.assertEqual(boggle.getSolution(), expected, index_class.__name__)
+            self.assertEqual(len(boggle.trie), len(set(current)))
+            self.assertIsInstance(boggle.trie, index_class)
+            self.assertTrue(NoRebuild.built, index_class.__name__)
+            other = Boggle(grid, None)
+            other.setIndex(shared)
+            self.assertEqual(other.getSolution(), before, index_class.__name__)
+
+    def test_edit_prebuilt_index_raises(self):
+        """DICTIONARY EDITS: A prebuilt index has no word list to edit"""
+        boggle = Boggle([], None)
+        boggle.setIndex(Trie.from_words(["art"]))
+        with self.assertRaises(ValueError):
+            boggle.addWords(["net"])
+
+    def test_dictionary_edits_during_threaded_solves(self):
+        """DICTIONARY EDITS: Solves on other threads see every edit whole or not at all"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 4)
+        full = Boggle(grid, dictionary).getSolution()
+        toggled = full[::3]
+        without = [w for w in full if w not in set(toggled)]
+        boggle = Boggle(grid, dictionary, engine="masked", solution_cache=SolutionCache())
+        stop = threading.Event()
+        seen = []
+
+        def solve():
+            while not stop.is_set():
+                seen.append(boggle.getSolution())
+
+        solvers = [threading.Thread(target=solve) for _ in range(2)]
+        for thread in solvers:
+            thread.start()
+        try:
+            for _ in range(30):
+                boggle.removeWords(toggled)
+                boggle.addWords(toggled)
+        finally:
+            stop.set()
+            for thread in solvers:
+                thread.join()
+        self.assertTrue(seen)
+        for solution in seen:
+            self.assertIn(solution, (full, without))
+        self.assertEqual(boggle.getSolution(), full)
+
+    # ========== WORD FILES ==========
+
+    def write_word_file(self, name, text, opener=open):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = os.path.join(tmpdir.name, name)
+        with opener(path, "wt") as file:
+            file.write(text)
+        return path
+
+    def test_streaming_reader_joins_words_across_chunks(self):
+        """WORD FILES: Words split by a chunk boundary are read whole"""
+        path = self.write_word_file("words.txt", "alpha beta\ngamma  delta\n\nepsilon")
+        expected = ["alpha", "beta", "gamma", "delta", "epsilon"]
+        for chunk_size in (1, 3, 7, 1 << 16):
+            self.assertEqual(list(iter_words_from_file(path, chunk_size)), expected)
+        self.assertEqual(read_words_from_file(path), expected)
+
+    def test_compressed_word_files_are_read_transparently(self):
+        """WORD FILES: gzip and bz2 lists are detected by content, not name"""
+        for opener in (gzip.open, bz2.open):
+            path = self.write_word_file("words", "art ego\nnet\n", opener)
+            self.assertEqual(read_words_from_file(path), ["art", "ego", "net"])
+
+    def test_iter_dictionary_filters_and_dedupes(self):
+        """WORD FILES: The dictionary stream keeps each valid word once"""
+        path = self.write_word_file("words.gz", "Art art ab x1y ego NET net\n", gzip.open)
+        self.assertEqual(list(iter_dictionary(path)), ["art", "ego", "net"])
+        grid = [["A", "R", "T"], ["E", "G", "O"], ["N", "E", "T"]]
+        self.assertEqual(Boggle(grid, iter_dictionary(path)).getSolution(),
+                         ["art", "ego", "net"])
+
+    # ========== COMMAND LINE ==========
+
+    def run_main(self, argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            main(argv)
+        return [json.loads(line) for line in stdout.getvalue().splitlines()], stderr.getvalue()
+
+    def test_cli_streams_json_lines_in_input_order(self):
+        """CLI: Every board line gets one output line, in input order"""
+        words = self.write_word_file("words.txt", "art ego net rat tar\n")
+        grids = [random_grid(4, seed) for seed in range(6)]
+        lines = [json.dumps(grid) for grid in grids]
+        lines.insert(2, json.dumps({"id": "a", "grid": [["T", "A", "R"], ["x"] * 3, ["x"] * 3]}))
+        lines.insert(4, "not json")
+        boards = self.write_word_file("boards.jsonl", "\n".join(lines) + "\n\n")
+        expected = [Boggle(grid, ["art", "ego", "net", "rat", "tar"]).getSolution()
+                    for grid in grids]
+        frozen = gc.get_freeze_count()
+        for workers in ("1", "2"):
+            output, stats = self.run_main([words, boards, "--workers", workers,
+                                           "--chunk-size", "2"])
+            self.assertEqual(gc.get_freeze_count(), frozen)
+            self.assertEqual(output[:2] + output[3:4] + output[5:], expected)
+            self.assertEqual(output[2], {"id": "a", "grid": [["T", "A", "R"], ["x"] * 3, ["x"] * 3],
+                                         "words": ["rat", "tar"]})
+            self.assertIn("error", output[4])
+            self.assertEqual(stats, "")
+
+    def test_cli_reads_snapshots_and_reports_stats(self):
+        """CLI: A trie snapshot is loaded directly and --stats goes to stderr"""
+        from trie_snapshot import compile_snapshot
+        path = self.write_word_file("words.txt", "")
+        compile_snapshot(["art", "ego", "net"], path)
+        boards = self.write_word_file("boards.jsonl", '[["A","R","T"],["E","G","O"],["N","E","T"]]\n')
+        output, stats = self.run_main([path, boards, "--stats"])
+        self.assertEqual(output, [["art", "ego", "net"]])
+        self.assertIn("1 boards in", stats)
+        self.assertIn("p99", stats)
+
+    def test_cli_rejects_invalid_counts(self):
+        """CLI: Negative --workers and non-positive --chunk-size are usage errors"""
+        for option, value in [("--workers", "-1"), ("--chunk-size", "0")]:
+            with self.assertRaises(SystemExit) as raised:
+                self.run_main(["words.txt", "-", option, value])
+            self.assertEqual(raised.exception.code, 2)
+
+    # ========== WORD LENGTH BOUNDS ==========
+
+    def test_max_remaining_and_height(self):
+        """BOUNDS: Every index reports the longest remaining suffix per node"""
+        from dawg import Dawg
+        from packed_trie import PackedTrie
+        words = ["art", "arts", "artist", "quart", "tie"]
+        for index_class in (Trie, PackedTrie, Dawg):
+            index = index_class.from_words(words)
+            self.assertEqual(index.height(), 6)
+            self.assertEqual(index.max_remaining(index.step(index.root, "ar")), 4)
+            self.assertEqual(index.max_remaining(index.step(index.root, "qu")), 3)
+            self.assertEqual(index.max_remaining(index.step(index.root, "artist")), 0)
+
+    def test_word_length_bounds_match_filtering(self):
+        """BOUNDS: min/max_word_length give the filtered full solution"""
+        dictionary = random_words(3000, seed=7) + ["quest", "stone", "tie"]
+        grid = random_grid(6, 3)
+        full = Boggle(grid, dictionary).getSolution()
+        for lo, hi in [(4, None), (None, 4), (5, 6), (7, 7), (6, 5)]:
+            expected = [w for w in full
+                        if len(w) >= (lo or 3) and (hi is None or len(w) <= hi)]
+            for engine in ("recursive", "bitmask", "masked", "pruned", "iterative"):
+                boggle = Boggle(grid, dictionary, engine=engine)
+                self.assertEqual(boggle.getSolution(min_word_length=lo,
+                                                    max_word_length=hi),
+                                 expected, (engine, lo, hi))
+            streamed = Boggle(grid, dictionary).iterSolution(min_word_length=lo,
+                                                             max_word_length=hi)
+            self.assertEqual(sorted(streamed), expected)
+
+    # ========== INSTRUMENTATION ==========
+
+    def test_stats_count_the_search(self):
+        """STATS: Every engine reports the same words and consistent counters"""
+        dictionary = random_words(3000, seed=7) + ["quest", "stone", "tie"]
+        grid = random_grid(6, 3)
+        expected = Boggle(grid, dictionary).getSolution()
+        for engine in ("recursive", "bitmask", "masked", "pruned", "iterative"):
+            boggle = Boggle(grid, dictionary, engine=engine, instrument=True)
+            self.assertIsNone(boggle.getStats())
+            self.assertEqual(boggle.getSolution(), expected, engine)
+            stats = boggle.getStats()
+            self.assertEqual((stats["engine"], stats["board_size"], stats["words_found"]),
+                             (engine, 6, len(expected)))
+            self.assertGreater(stats["dfs_calls"], stats["pruned"])
+            self.assertGreaterEqual(stats["max_depth"], max(len(w) for w in expected))
+            self.assertEqual(sorted(stats["seconds"]),
+                             sorted(["normalize", "filter", "build", "search", "sort"]))
+            self.assertGreater(stats["seconds"]["search"], 0)
+        # Exhaustive engines step into every neighbor; the masked engine
+        # only into those that can continue the prefix
+        recursive = Boggle(grid, dictionary, instrument=True)
+        masked = Boggle(grid, dictionary, engine="masked", instrument=True)
+        recursive.getSolution()
+        masked.getSolution()
+        self.assertEqual(recursive.getStats()["node_visits"],
+                         masked.getStats()["node_visits"])
+        self.assertLess(masked.getStats()["pruned"], recursive.getStats()["pruned"])
+        # The pruned engine only skips work: re-walking found words to
+        # count them off is not search and must not be counted
+        pruned = Boggle(grid, dictionary, engine="pruned", instrument=True)
+        pruned.getSolution()
+        for counter in ("dfs_calls", "node_visits"):
+            self.assertLessEqual(pruned.getStats()[counter], masked.getStats()[counter])
+
+    def test_stats_hook_and_setup_phases(self):
+        """STATS: The hook gets every solve; setup time goes to the next solve"""
+        seen = []
+        boggle = Boggle(random_grid(4, 1), random_words(500, seed=2), stats_hook=seen.append)
+        boggle.getSolution()
+        boggle.getSolution()
+        self.assertEqual(len(seen), 2)
+        self.assertGreater(seen[0]["seconds"]["filter"], 0)
+        self.assertEqual(seen[1]["seconds"]["filter"], 0)
+        self.assertEqual(boggle.getStats(), seen[1])
+        boggle.getStats()["seconds"]["search"] = -1
+        self.assertNotEqual(boggle.getStats()["seconds"]["search"], -1)
+
+        def broken_hook(stats):
+            raise RuntimeError("hook failed")
+        with self.assertRaises(RuntimeError):
+            Boggle(random_grid(4, 1), ["abc"], stats_hook=broken_hook).getSolution()
+
+    def test_stats_across_workers_and_cache(self):
+        """STATS: Pool searches are summed in and cache hits are marked"""
+        dictionary = random_words(3000, seed=7)
+        grid = random_grid(6, 2)
+        serial = Boggle(grid, dictionary, engine="masked", instrument=True)
+        serial.getSolution()
+        for pool in ("thread", "process"):
+            boggle = Boggle(grid, dictionary, engine="masked", workers=2, pool=pool,
+                            instrument=True)
+            boggle.getSolution()
+            self.assertEqual(boggle.getStats(), dict(serial.getStats(),
+                                                     seconds=boggle.getStats()["seconds"]))
+
+        cached = Boggle(grid, dictionary, solution_cache=SolutionCache(), instrument=True)
+        words = cached.getSolution()
+        cached.getSolution()
+        stats = cached.getStats()
+        self.assertTrue(stats["cached"])
+        self.assertEqual((stats["dfs_calls"], stats["words_found"]), (0, len(words)))
+
+    def test_stats_off_by_default(self):
+        """STATS: Uninstrumented solvers search the index itself and record nothing"""
+        boggle = Boggle(random_grid(4, 1), random_words(500, seed=2))
+        boggle.getSolution()
+        self.assertIsNone(boggle.getStats())
+        self.assertEqual(boggle._setup_seconds, {})
 
 if __name__ == '__main__':
     unittest.main()
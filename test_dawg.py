@@ -0,0 +1,62 @@
+import unittest
+from boggle_solver import Boggle, Trie
+from dawg import Dawg
+from test_boggle_solver import random_grid, random_words
+
+
+class TestDawg(unittest.TestCase):
+    """Minimal DAWG must answer the same queries as Trie"""
+
+    def setUp(self):
+        self.words = ["tap", "taps", "tapping", "top", "tops", "topping",
+                      "stop", "stops", "stopping", "quit"]
+        self.trie = Trie.from_words(self.words)
+        self.dawg = Dawg.from_words(self.words)
+
+    def test_search_and_starts_with_match_trie(self):
+        """search()/starts_with() agree with Trie on words, prefixes and misses"""
+        probes = self.words + ["", "t", "ta", "tapp", "toppings", "sto", "qu", "x"]
+        for probe in probes:
+            self.assertEqual(self.dawg.search(probe), self.trie.search(probe), probe)
+            self.assertEqual(self.dawg.starts_with(probe),
+                             self.trie.starts_with(probe), probe)
+
+    def test_shared_suffixes_are_merged(self):
+        """Equivalent suffix subtrees collapse into shared nodes"""
+        self.assertEqual(len(self.dawg), len(self.words))
+        # "ap"/"op" endings share the "s"/"ping" tails
+        self.assertIs(self.dawg.step(self.dawg.root, "ta").children["p"],
+                      self.dawg.step(self.dawg.root, "to").children["p"])
+        self.assertLess(self.dawg.node_count(), 15)
+
+    def test_unsorted_duplicate_input(self):
+        """Input order and duplicates do not matter"""
+        dawg = Dawg.from_words(["tops", "top", "tops", "art"])
+        self.assertEqual(len(dawg), 3)
+        self.assertTrue(dawg.search("top"))
+        self.assertFalse(dawg.search("to"))
+
+    def test_boggle_with_dawg_matches_default(self):
+        """Boggle gives identical solutions with the DAWG index"""
+        dictionary = random_words(3000, seed=3)
+        for seed in range(3):
+            grid = random_grid(5, seed)
+            expected = Boggle(grid, dictionary).getSolution()
+            self.assertEqual(Boggle(grid, dictionary, index_class=Dawg).getSolution(),
+                             expected)
+
+    def test_fork_edits_do_not_leak_through_shared_suffixes(self):
+        """Editing a word copies its shared suffix nodes instead of changing them"""
+        fork = self.dawg.fork()
+        fork.remove("taps")
+        fork.insert("topper")
+        self.assertFalse(fork.search("taps"))
+        self.assertTrue(fork.search("tops") and fork.search("stops"))
+        self.assertTrue(fork.search("topper") and fork.search("tapping"))
+        self.assertFalse(fork.search("tapper") or fork.search("stopper"))
+        self.assertEqual(len(fork), len(self.words))
+        self.assertTrue(all(self.dawg.search(word) for word in self.words))
+        self.assertFalse(self.dawg.search("topper"))
+
+if __name__ == '__main__':
+    unittest.main()
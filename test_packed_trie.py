@@ -0,0 +1,97 @@
+import unittest
+from boggle_solver import Boggle, Trie
+from packed_trie import PackedTrie
+from test_boggle_solver import random_grid, random_words
+
+
+class TestPackedTrie(unittest.TestCase):
+    """Packed array trie must behave exactly like Trie"""
+
+    def setUp(self):
+        self.words = ["art", "arts", "artist", "quart", "stone", "tie", "tied"]
+        self.trie = Trie()
+        self.packed = PackedTrie()
+        for word in self.words:
+            self.trie.insert(word)
+            self.packed.insert(word)
+
+    def test_search_matches_trie(self):
+        """search() agrees with Trie for words, prefixes and misses"""
+        for probe in self.words + ["", "ar", "artis", "quartz", "xyz", "ti"]:
+            self.assertEqual(self.packed.search(probe), self.trie.search(probe), probe)
+
+    def test_starts_with_matches_trie(self):
+        """starts_with() agrees with Trie for prefixes and misses"""
+        for probe in ["", "a", "art", "artisx", "qu", "q", "st", "z"]:
+            self.assertEqual(self.packed.starts_with(probe),
+                             self.trie.starts_with(probe), probe)
+
+    def test_step_consumes_whole_tile(self):
+        """step() follows every character of a multi-letter tile"""
+        node = self.packed.step(self.packed.root, "qu")
+        self.assertIsNotNone(node)
+        self.assertFalse(self.packed.is_word(node))
+        self.assertTrue(self.packed.is_word(self.packed.step(node, "art")))
+        self.assertIsNone(self.packed.step(self.packed.root, "qa"))
+
+    def test_child_mask_matches_trie(self):
+        """child_mask() agrees with Trie for every prefix"""
+        for prefix in ["", "a", "ar", "art", "qu", "ti", "tie"]:
+            self.assertEqual(
+                self.packed.child_mask(self.packed.step(self.packed.root, prefix)),
+                self.trie.child_mask(self.trie.step(self.trie.root, prefix)), prefix)
+
+    def test_duplicate_insert_counted_once(self):
+        """Inserting an existing word does not grow the trie"""
+        nodes = self.packed.node_count()
+        self.packed.insert("arts")
+        self.assertEqual(self.packed.node_count(), nodes)
+        self.assertEqual(len(self.packed), len(self.words))
+
+    def test_bulk_build_matches_repeated_insert(self):
+        """from_words gives the same lookups and counters as insert()"""
+        words = random_words(2000, seed=5) + self.words
+        built = PackedTrie.from_words(words)
+        inserted = PackedTrie()
+        for word in words:
+            inserted.insert(word)
+        self.assertEqual((len(built), built.node_count()),
+                         (len(inserted), inserted.node_count()))
+        for prefix in ["", "a", "ar", "art", "qu", "ti", "sto"] + words[:200]:
+            b, i = built.step(0, prefix), inserted.step(0, prefix)
+            self.assertEqual((built.is_word(b), built.child_mask(b),
+                              built.max_remaining(b), built.word_count(b)),
+                             (inserted.is_word(i), inserted.child_mask(i),
+                              inserted.max_remaining(i), inserted.word_count(i)), prefix)
+
+    def test_boggle_with_packed_trie_matches_default(self):
+        """Boggle gives identical solutions with either index"""
+        dictionary = random_words(3000, seed=11)
+        for seed in range(3):
+            grid = random_grid(5, seed)
+            expected = Boggle(grid, dictionary).getSolution()
+            packed = Boggle(grid, dictionary, index_class=PackedTrie)
+            self.assertIsInstance(packed.trie, PackedTrie)
+            self.assertEqual(packed.getSolution(), expected)
+
+    def test_remove_unlinks_nodes_and_refreshes_bounds(self):
+        """remove() on a fork matches a trie built without the words"""
+        fork = self.packed.fork()
+        self.assertTrue(fork.remove("artist"))
+        self.assertTrue(fork.remove("tie"))
+        self.assertFalse(fork.remove("tie"))
+        self.assertFalse(fork.remove("ar"))
+        expected = PackedTrie.from_words(["art", "arts", "quart", "stone", "tied"])
+        for prefix in ["", "a", "art", "arti", "t", "ti", "tie", "tied", "qu"]:
+            f, e = fork.step(0, prefix), expected.step(0, prefix)
+            self.assertEqual(f is None, e is None, prefix)
+            if f is not None:
+                self.assertEqual((fork.is_word(f), fork.child_mask(f),
+                                  fork.max_remaining(f), fork.word_count(f)),
+                                 (expected.is_word(e), expected.child_mask(e),
+                                  expected.max_remaining(e), expected.word_count(e)), prefix)
+        self.assertEqual(len(fork), 5)
+        self.assertTrue(self.packed.search("artist") and self.packed.search("tie"))
+
+if __name__ == '__main__':
+    unittest.main()
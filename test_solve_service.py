@@ -0,0 +1,146 @@
+import asyncio
+import gc
+import unittest
+from boggle_solver import Boggle
+from solve_service import ServiceBusy, SolveService
+from test_boggle_solver import random_grid, random_words
+
+
+class TestSolveService(unittest.TestCase):
+    """asyncio front-end must return Boggle's solutions without blocking"""
+
+    def setUp(self):
+        self.dictionary = random_words(3000, seed=7)
+
+    def test_solutions_match_boggle(self):
+        """Thread and process executors return the same words as getSolution"""
+        grids = [random_grid(5, seed) for seed in range(4)]
+        expected = [Boggle(grid, self.dictionary).getSolution() for grid in grids]
+        for executor in ("thread", "process"):
+            async def solve_all():
+                async with SolveService(self.dictionary, max_concurrency=2,
+                                        executor=executor) as service:
+                    return await asyncio.gather(*(service.solve(g) for g in grids))
+            self.assertEqual(asyncio.run(solve_all()), expected, executor)
+
+    def test_instrumented_copies_keep_their_own_setup_time(self):
+        """Thread executor copies report their own setGrid time, not the template's"""
+        grids = [random_grid(5, seed) for seed in range(6)]
+        reported = []
+
+        async def solve_all():
+            async with SolveService(self.dictionary, max_concurrency=3, instrument=True,
+                                    stats_hook=reported.append) as service:
+                setup = dict(service.boggle._setup_seconds)
+                results = await asyncio.gather(*(service.solve(g) for g in grids))
+                return service, setup, results
+        service, setup, results = asyncio.run(solve_all())
+        self.assertEqual(service.boggle._setup_seconds, setup)
+        self.assertEqual(sorted(stats["words_found"] for stats in reported),
+                         sorted(len(result) for result in results))
+        self.assertTrue(all(stats["seconds"]["build"] == 0 for stats in reported))
+
+    def test_identical_boards_share_one_computation(self):
+        """Concurrent requests for a board and its rotation are coalesced"""
+        grid = random_grid(6, 3)
+        rotated = [list(row) for row in zip(*grid[::-1])]
+
+        async def solve_all():
+            async with SolveService(self.dictionary) as service:
+                results = await asyncio.gather(
+                    *(service.solve(grid if i % 2 else rotated) for i in range(10)))
+                return service, results
+        service, results = asyncio.run(solve_all())
+        expected = Boggle(grid, self.dictionary).getSolution()
+        self.assertTrue(all(result == expected for result in results))
+        self.assertEqual((service.solves, service.coalesced), (1, 9))
+
+    def test_full_queue_rejects_requests(self):
+        """Boards beyond max_concurrency + max_queue raise ServiceBusy"""
+        async def solve_all():
+            async with SolveService(self.dictionary, max_concurrency=1,
+                                    max_queue=1) as service:
+                results = await asyncio.gather(
+                    *(service.solve(random_grid(6, seed)) for seed in range(3)),
+                    return_exceptions=True)
+                return service, results
+        service, results = asyncio.run(solve_all())
+        self.assertIsInstance(results[2], ServiceBusy)
+        self.assertEqual(service.rejected, 1)
+        self.assertEqual(service.solves, 2)
+
+    def test_abandoned_queued_solve_never_starts(self):
+        """A queued board whose only client was cancelled is dropped"""
+        async def solve_all():
+            async with SolveService(self.dictionary, max_concurrency=1) as service:
+                running = asyncio.ensure_future(service.solve(random_grid(8, 1)))
+                queued = asyncio.ensure_future(service.solve(random_grid(8, 2)))
+                await asyncio.sleep(0)
+                queued.cancel()
+                await running
+                with self.assertRaises(asyncio.CancelledError):
+                    await queued
+                return service
+        service = asyncio.run(solve_all())
+        self.assertEqual((service.solves, service.dropped, service.pending), (1, 1, 0))
+
+    def test_request_after_cancel_starts_afresh(self):
+        """A board asked for again after its only client left is solved anew"""
+        grid = random_grid(8, 2)
+        mirrored = [row[::-1] for row in grid]
+
+        async def solve_all():
+            async with SolveService(self.dictionary, max_concurrency=1) as service:
+                running = asyncio.ensure_future(service.solve(random_grid(8, 1)))
+                queued = asyncio.ensure_future(service.solve(grid))
+                await asyncio.sleep(0)
+                queued.cancel()
+                await asyncio.sleep(0)
+                again = await service.solve(mirrored)
+                await running
+                return again
+        self.assertEqual(asyncio.run(solve_all()),
+                         Boggle(grid, self.dictionary).getSolution())
+
+    def test_abandoned_running_solve_keeps_its_slot(self):
+        """A cancelled solve still in the executor counts against the limits"""
+        async def solve_all():
+            async with SolveService(self.dictionary, max_concurrency=1,
+                                    max_queue=0) as service:
+                running = asyncio.ensure_future(service.solve(random_grid(12, 1)))
+                await asyncio.sleep(0)
+                running.cancel()
+                for _ in range(5):  # let the cancellation settle
+                    await asyncio.sleep(0)
+                with self.assertRaises(ServiceBusy):
+                    await service.solve(random_grid(4, 2))
+                while service.pending:
+                    await asyncio.sleep(0.01)
+                return service, await service.solve(random_grid(4, 2))
+        service, words = asyncio.run(solve_all())
+        self.assertEqual(words, Boggle(random_grid(4, 2), self.dictionary).getSolution())
+        self.assertEqual((service.solves, service.rejected, service.pending), (2, 1, 0))
+
+    def test_invalid_boards_are_not_coalesced(self):
+        """Non-square boards get no words, not those of a board they truncate to"""
+        square = [["s", "t"], ["o", "p"]]
+        ragged = [["s", "t"], ["o", "p", "e"]]
+
+        async def solve_all():
+            async with SolveService(["stop", "pots", "tops", "post"]) as service:
+                return await asyncio.gather(service.solve(square), service.solve(ragged),
+                                            service.solve([]))
+        results = asyncio.run(solve_all())
+        self.assertEqual(results[1:], [Boggle(ragged, ["stop"]).getSolution(), []])
+        self.assertEqual(results[1], [])
+        self.assertNotEqual(results[0], [])
+
+    def test_gc_left_alone_by_default(self):
+        """Only freeze_index=True moves objects out of the collector's reach"""
+        frozen = gc.get_freeze_count()
+        SolveService(self.dictionary).close()
+        self.assertEqual(gc.get_freeze_count(), frozen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import gzip
+import os
+import tempfile
+import unittest
+from boggle_solver import Boggle, Trie, check_index
+from sorted_index import SortedIndex
+from test_boggle_solver import random_grid, random_words
+
+
+class TestSortedIndex(unittest.TestCase):
+    """Bisect index over a sorted word list must answer like Trie"""
+
+    def setUp(self):
+        self.words = ["art", "arts", "artist", "quart", "stone", "tie", "tied"]
+        self.trie = Trie.from_words(self.words)
+        self.index = SortedIndex.from_words(self.words)
+
+    def test_search_and_starts_with_match_trie(self):
+        """search()/starts_with() agree with Trie on words, prefixes and misses"""
+        probes = self.words + ["", "a", "ar", "artis", "quartz", "xyz", "ti", "zzz"]
+        for probe in probes:
+            self.assertEqual(self.index.search(probe), self.trie.search(probe), probe)
+            self.assertEqual(self.index.starts_with(probe),
+                             self.trie.starts_with(probe), probe)
+
+    def test_step_consumes_whole_tile(self):
+        """step() narrows by every character of a multi-letter tile"""
+        node = self.index.step(self.index.root, "qu")
+        self.assertIsNotNone(node)
+        self.assertFalse(self.index.is_word(node))
+        self.assertTrue(self.index.is_word(self.index.step(node, "art")))
+        self.assertIsNone(self.index.step(self.index.root, "qa"))
+        self.assertIsNone(self.index.step(self.index.step(self.index.root, "tie"), "s"))
+
+    def test_from_sorted_file_filters_and_checks_order(self):
+        """A sorted file loads as is; an unsorted one raises ValueError"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "words.gz")
+            with gzip.open(path, "wt") as file:
+                file.write("ab\nart\nart\nArts\nego\nx1y\nnet\n")
+            index = SortedIndex.from_sorted_file(path)
+            self.assertEqual(index.words, ["art", "arts", "ego", "net"])
+            with gzip.open(path, "wt") as file:
+                file.write("net\nart\n")
+            with self.assertRaises(ValueError):
+                SortedIndex.from_sorted_file(path)
+
+    def test_index_protocol_is_checked(self):
+        """Objects without the index methods are rejected with TypeError"""
+        check_index(self.index)
+        check_index(SortedIndex)
+        with self.assertRaises(TypeError):
+            Boggle([], ["art"], index_class=dict)
+        with self.assertRaises(TypeError):
+            Boggle([], None).setIndex(["art"])
+
+    def test_boggle_with_sorted_index_matches_default(self):
+        """Boggle gives identical solutions with the bisect index"""
+        dictionary = random_words(3000, seed=11) + ["quest", "stone", "tie"]
+        for seed in range(3):
+            grid = random_grid(5, seed)
+            expected = Boggle(grid, dictionary).getSolution()
+            for engine in ("recursive", "bitmask", "masked", "pruned", "iterative"):
+                boggle = Boggle(grid, dictionary, index_class=SortedIndex, engine=engine)
+                self.assertEqual(boggle.getSolution(), expected, engine)
+
+    def test_fork_edits_keep_words_sorted(self):
+        """insert()/remove() on a fork keep the list sorted and the original intact"""
+        fork = self.index.fork()
+        fork.insert("bee")
+        fork.insert("bee")
+        self.assertTrue(fork.remove("arts"))
+        self.assertFalse(fork.remove("arts"))
+        self.assertEqual(fork.words, sorted(set(self.words) - {"arts"} | {"bee"}))
+        self.assertEqual(fork.root, ("", 0, len(fork.words)))
+        self.assertTrue(fork.is_word(fork.step(fork.root, "bee")))
+        self.assertEqual(self.index.words, sorted(self.words))
+
+if __name__ == '__main__':
+    unittest.main()
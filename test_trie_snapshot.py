@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+import unittest
+from boggle_solver import Boggle, Trie
+from trie_snapshot import compile_snapshot, load_snapshot
+from test_boggle_solver import random_grid, random_words
+
+
+class TestTrieSnapshot(unittest.TestCase):
+    """Compiled snapshots must answer the same queries as an in-memory Trie"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "words.trie")
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def test_lookups_match_trie(self):
+        """search()/starts_with() agree with Trie after a round trip"""
+        words = ["Art", "arts", "quart", "stone", "tie", "no", "x1y"]
+        self.assertEqual(compile_snapshot(words, self.path), 5)
+        trie = Trie.from_words(["art", "arts", "quart", "stone", "tie"])
+        with load_snapshot(self.path) as mapped:
+            self.assertEqual(len(mapped), 5)
+            for probe in ["art", "arts", "ar", "quart", "qu", "stone", "no", "tie", "x"]:
+                self.assertEqual(mapped.search(probe), trie.search(probe), probe)
+                self.assertEqual(mapped.starts_with(probe), trie.starts_with(probe), probe)
+
+    def test_snapshot_is_read_only(self):
+        """Mapped tries refuse inserts"""
+        compile_snapshot(["art"], self.path)
+        with load_snapshot(self.path) as mapped:
+            with self.assertRaises(TypeError):
+                mapped.insert("rat")
+
+    def test_rejects_foreign_file(self):
+        """Files without the snapshot header raise ValueError"""
+        with open(self.path, "wb") as file:
+            file.write(b"not a snapshot at all, just some bytes")
+        with self.assertRaises(ValueError):
+            load_snapshot(self.path)
+
+    def test_boggle_with_snapshot_matches_default(self):
+        """Boggle.setIndex solves against a snapshot with identical results"""
+        dictionary = random_words(3000, seed=5)
+        compile_snapshot(dictionary, self.path)
+        with load_snapshot(self.path) as mapped:
+            for seed in range(3):
+                grid = random_grid(5, seed)
+                boggle = Boggle(grid, None)
+                boggle.setIndex(mapped)
+                self.assertEqual(boggle.getSolution(),
+                                 Boggle(grid, dictionary).getSolution())
+
+    def test_empty_snapshot(self):
+        """A snapshot of an empty dictionary solves to an empty list"""
+        compile_snapshot([], self.path)
+        with load_snapshot(self.path) as mapped:
+            boggle = Boggle([["A", "B"], ["C", "D"]], None)
+            boggle.setIndex(mapped)
+            self.assertEqual(boggle.getSolution(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
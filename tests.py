@@ -1,13 +1,153 @@
 import unittest
 import sys
+import json
+import os
+import platform
+import random
+import time
+import tracemalloc
 
 sys.path.append("/home/codio/workspace/") #have to tell the unittest the PATH to find boggle_solver.py and the Boggle Class
 
-from boggle_solver import Boggle
+from boggle_solver import Boggle, iter_dictionary, clear_index_cache
+
+# Scalability benchmark settings, read from the environment so the suite
+# runs the same under "python tests.py" and "python -m unittest discover":
+#   BOGGLE_BENCH=1               run the timed benchmark matrix
+#   BOGGLE_BENCH_FULL=1          add 20x20..50x50 boards and 500k words
+#   BOGGLE_BENCH_WRITE=path      store the results as a JSON baseline
+#   BOGGLE_BENCH_BASELINE=path   fail on regressions against a baseline
+#   BOGGLE_BENCH_THRESHOLD=0.25  allowed slowdown/growth (0.25 = 25%)
+#   BOGGLE_BENCH_WORDS=path      draw dictionaries from a real word list
+#   BOGGLE_BENCH_ENGINE=masked   search engine to time
+BENCH_SIZES = [4, 5, 6, 8, 10, 13]
+BENCH_FULL_SIZES = [20, 30, 50]
+BENCH_DICTIONARIES = [1000, 10000, 100000]
+BENCH_FULL_DICTIONARIES = [500000]
+BENCH_METRICS = ["build_s", "solve_s", "build_peak_mib", "solve_peak_mib"]
+
+# Letters weighted roughly by English frequency
+LETTERS = "eeeeeeeeeeeeaaaaaaaaaiiiiiiiiioooooooonnnnnnrrrrrrttttttllllssssuuuu" \
+          "ddddgggbbccmmppffhhvvwwyykjxqz"
+
+# The 16 dice of the standard 4x4 game
+DICE = ["AAEEGN", "ABBJOO", "ACHOPS", "AFFKPS", "AOOTTW", "CIMOTU", "DEILRX", "DELRVY",
+        "DISTTY", "EEGHNW", "EEINSU", "EHRTVW", "EIOSST", "ELRTTY", "HIMNUQ", "HLNNRZ"]
+
+
+def random_board(n, seed):
+  """Seeded NxN board of letters drawn by English letter frequency"""
+  rng = random.Random(seed)
+  return [["Qu" if c == "q" else c.upper() for c in (rng.choice(LETTERS) for _ in range(n))]
+          for _ in range(n)]
+
+
+def dice_board(n, seed):
+  """Seeded NxN board rolled from the standard dice, reusing the set past 16 cells"""
+  rng = random.Random(seed)
+  dice = []
+  while len(dice) < n * n:
+    dice.extend(rng.sample(DICE, len(DICE)))
+  faces = ["Qu" if face == "Q" else face for face in (rng.choice(die) for die in dice[:n * n])]
+  return [faces[row * n:(row + 1) * n] for row in range(n)]
+
+
+def synthetic_dictionary(count, seed=0):
+  """Seeded list of count distinct pseudo-words, or count words of BOGGLE_BENCH_WORDS"""
+  path = os.environ.get("BOGGLE_BENCH_WORDS")
+  if path:
+    words = []
+    for word in iter_dictionary(path):
+      words.append(word)
+      if len(words) == count:
+        break
+    return words
+  rng = random.Random(seed)
+  suffixes = ["", "", "", "s", "ed", "ing", "er", "ly", "tion", "ness"]
+  words = set()
+  while len(words) < count:
+    stem = "".join(rng.choice(LETTERS) for _ in range(rng.randint(3, 8)))
+    words.add(stem + rng.choice(suffixes))
+  return sorted(words)
+
+
+def measure_build(words, engine):
+  """
+  Times building the index for words, and traces its peak memory
+
+  Returns:
+    (Boggle holding the index, {"build_s", "build_peak_mib"}); the time
+    is the best of five builds, the memory is traced in a sixth so
+    tracing does not slow the timed ones
+  """
+  build_s = float("inf")
+  for _ in range(5):
+    clear_index_cache()
+    start = time.perf_counter()
+    Boggle([], words, engine=engine)
+    build_s = min(build_s, time.perf_counter() - start)
+  clear_index_cache()
+  tracemalloc.start()
+  try:
+    game = Boggle([], words, engine=engine)
+    build_peak = tracemalloc.get_traced_memory()[1]
+  finally:
+    tracemalloc.stop()
+  return game, {"build_s": build_s, "build_peak_mib": build_peak / 2 ** 20}
+
+
+def measure_solve(game, board):
+  """
+  Times solving board and traces what the solve allocates
+
+  Like timeit, each of five rounds repeats the solve for at least 0.1s
+  and the fastest round's mean is kept, so short solves are not lost in
+  timer and scheduler noise.
+  """
+  game.setGrid(board)
+  solve_s = float("inf")
+  for _ in range(5):
+    calls = 0
+    start = time.perf_counter()
+    while True:
+      solution = game.getSolution()
+      calls += 1
+      elapsed = time.perf_counter() - start
+      if elapsed >= 0.1:
+        break
+    solve_s = min(solve_s, elapsed / calls)
+  tracemalloc.start()
+  try:
+    game.getSolution()
+    solve_peak = tracemalloc.get_traced_memory()[1]
+  finally:
+    tracemalloc.stop()
+  return {"solve_s": solve_s, "solve_peak_mib": solve_peak / 2 ** 20,
+          "words_found": len(solution)}
+
+
+def compare_to_baseline(results, baseline, threshold):
+  """Returns a message for every metric that grew past baseline * (1 + threshold)"""
+  regressions = []
+  for name, metrics in results.items():
+    old = baseline.get(name)
+    if old is None:
+      continue
+    if old.get("words_found") != metrics.get("words_found"):
+      regressions.append(f"{name}: found {metrics.get('words_found')} words, "
+                         f"baseline {old.get('words_found')}")
+    for metric in BENCH_METRICS:
+      # Ignore differences too small to time or trace reliably
+      floor = 0.02 if metric.endswith("_s") else 0.5
+      if metric in old and metric in metrics and \
+          metrics[metric] > max(old[metric], floor) * (1 + threshold):
+        regressions.append(f"{name}: {metric} {metrics[metric]:.4f} vs baseline "
+                           f"{old[metric]:.4f} (+{threshold:.0%} allowed)")
+  return regressions
+
 
 class TestSuite_Alg_Scalability_Cases(unittest.TestCase):
 
-  # ADD 4x4, 5x5, 6x6, 7x7...13x13, and LARGER Dictionaries
   def test_Normal_case_3x3(self):
     grid = [["A", "B", "C"],["D", "E", "F"],["G", "H", "I"]]
     dictionary = ["abc", "abdhi", "abi", "ef", "cfi", "dea"]
@@ -20,6 +160,96 @@ class TestSuite_Alg_Scalability_Cases(unittest.TestCase):
     expected = sorted(expected)
     self.assertEqual(expected, solution)
 
+  # 4x4 through 13x13 boards, random and rolled from dice, 10k words:
+  # the optimized engine must agree with the original recursive search
+  def check_square_case(self, n):
+    dictionary = synthetic_dictionary(10000)
+    words = set(dictionary)
+    for board in (random_board(n, seed=n), dice_board(n, seed=n)):
+      solution = Boggle(board, dictionary, engine="masked").getSolution()
+      self.assertEqual(solution, Boggle(board, dictionary).getSolution())
+      self.assertEqual(solution, sorted(solution))
+      self.assertTrue(words.issuperset(solution))
+
+  def test_Normal_case_4x4(self):
+    self.check_square_case(4)
+
+  def test_Normal_case_5x5(self):
+    self.check_square_case(5)
+
+  def test_Normal_case_6x6(self):
+    self.check_square_case(6)
+
+  def test_Normal_case_7x7(self):
+    self.check_square_case(7)
+
+  def test_Normal_case_8x8(self):
+    self.check_square_case(8)
+
+  def test_Normal_case_9x9(self):
+    self.check_square_case(9)
+
+  def test_Normal_case_10x10(self):
+    self.check_square_case(10)
+
+  def test_Normal_case_11x11(self):
+    self.check_square_case(11)
+
+  def test_Normal_case_12x12(self):
+    self.check_square_case(12)
+
+  def test_Normal_case_13x13(self):
+    self.check_square_case(13)
+
+  def test_Dice_boards_use_standard_faces(self):
+    faces = set("".join(DICE).replace("Q", ""))
+    board = dice_board(20, seed=1)
+    self.assertEqual(len(board), 20)
+    self.assertTrue(all(tile == "Qu" or tile in faces for row in board for tile in row))
+    self.assertEqual(board, dice_board(20, seed=1))
+
+  def test_Baseline_comparison_flags_regressions(self):
+    baseline = {"4x4-dice-1k": {"build_s": 1.0, "solve_s": 1.0, "build_peak_mib": 10.0,
+                                "solve_peak_mib": 1.0, "words_found": 5}}
+    same = dict(baseline["4x4-dice-1k"], solve_s=1.2)
+    self.assertEqual(compare_to_baseline({"4x4-dice-1k": same}, baseline, 0.25), [])
+    slower = dict(same, solve_s=1.3, words_found=6)
+    self.assertEqual(len(compare_to_baseline({"4x4-dice-1k": slower}, baseline, 0.25)), 2)
+
+  @unittest.skipUnless(os.environ.get("BOGGLE_BENCH"), "set BOGGLE_BENCH=1 to run benchmarks")
+  def test_Scalability_benchmark(self):
+    full = bool(os.environ.get("BOGGLE_BENCH_FULL"))
+    sizes = BENCH_SIZES + (BENCH_FULL_SIZES if full else [])
+    counts = BENCH_DICTIONARIES + (BENCH_FULL_DICTIONARIES if full else [])
+    engine = os.environ.get("BOGGLE_BENCH_ENGINE", "masked")
+    threshold = float(os.environ.get("BOGGLE_BENCH_THRESHOLD", "0.25"))
+
+    results = {}
+    for count in counts:
+      words = synthetic_dictionary(count)
+      game, results[f"build-{count // 1000}k"] = measure_build(words, engine)
+      for n in sizes:
+        for kind in ("random", "dice"):
+          board = (dice_board if kind == "dice" else random_board)(n, seed=n)
+          results[f"{n}x{n}-{kind}-{count // 1000}k"] = measure_solve(game, board)
+    for name, metrics in results.items():
+      print(f"{name:<20} " + "  ".join(f"{metric} {value:.4f}" if isinstance(value, float)
+                                       else f"{metric} {value}"
+                                       for metric, value in metrics.items()), file=sys.stderr)
+
+    path = os.environ.get("BOGGLE_BENCH_WRITE")
+    if path:
+      with open(path, "w") as file:
+        json.dump({"python": platform.python_version(), "engine": engine,
+                   "cases": results}, file, indent=2, sort_keys=True)
+    path = os.environ.get("BOGGLE_BENCH_BASELINE")
+    if path:
+      with open(path) as file:
+        baseline = json.load(file)["cases"]
+      regressions = compare_to_baseline(results, baseline, threshold)
+      if regressions:
+        self.fail(f"{len(regressions)} regressions against {path}:\n" + "\n".join(regressions))
+
 class TestSuite_Simple_Edge_Cases(unittest.TestCase):
   #ADD MANY SIMPLE TEST CASES
   def test_SquareGrid_case_1x1(self):
@@ -56,4 +286,3 @@ class TestSuite_Qu_and_St(unittest.TestCase):
 
 if __name__ == '__main__':
     unittest.main()
-
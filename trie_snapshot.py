@@ -0,0 +1,143 @@
+"""
+On-disk, memory-mapped dictionary snapshots
+
+A snapshot is a PackedTrie's node tables written to a file once. Loading
+it maps the file read-only and answers lookups straight from the mapped
+pages, so startup cost does not depend on the dictionary size and every
+process on the host shares one copy through the page cache.
+
+Usage: python trie_snapshot.py <wordlist[.gz|.bz2]> <snapshot>
+"""
+import mmap
+import os
+import struct
+import sys
+
+from boggle_solver import filter_words, iter_dictionary
+from packed_trie import PackedTrie
+
+MAGIC = b"BOGTRIE1"
+BYTE_ORDER_MARK = 0x01020304
+# magic, byte order mark, padding, node count, word count
+HEADER = struct.Struct("=8sII QQ")
+
+
+def write_snapshot(trie, path):
+    """
+    Writes a PackedTrie to path as a snapshot
+
+    The file is written next to path and renamed into place, so processes
+    that already mapped the old snapshot keep a consistent view.
+
+    Args:
+        trie: PackedTrie to write
+        path: destination file path
+    """
+    tmp_path = f"{path}.tmp{os.getpid()}"
+    with open(tmp_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, BYTE_ORDER_MARK, 0,
+                               trie.node_count(), len(trie)))
+        file.write(trie.labels.tobytes())
+        file.write(trie.first_child.tobytes())
+        file.write(trie.next_sibling.tobytes())
+        file.write(trie.terminal)
+    os.replace(tmp_path, path)
+
+
+def compile_snapshot(dictionary, path):
+    """
+    Filters a word list like Boggle.setDictionary and writes its snapshot
+
+    Args:
+        dictionary: iterable of words
+        path: destination file path
+
+    Returns:
+        The number of words in the snapshot
+    """
+    trie = PackedTrie.from_words(filter_words(dictionary))
+    write_snapshot(trie, path)
+    return len(trie)
+
+
+class MappedTrie:
+    """
+    Read-only PackedTrie served from a memory-mapped snapshot file
+
+    The node tables are memoryview casts over the mapping, so nothing is
+    copied at load time. Use Boggle.setIndex to solve against it.
+    """
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mmap) < HEADER.size:
+                raise ValueError(f"{path} is not a trie snapshot")
+            magic, mark, _, nodes, words = HEADER.unpack_from(self._mmap)
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a trie snapshot")
+            if mark != BYTE_ORDER_MARK:
+                raise ValueError(f"{path} was written with a different byte order")
+            if len(self._mmap) != HEADER.size + 13 * nodes:
+                raise ValueError(f"{path} is truncated")
+        except ValueError:
+            self._mmap.close()
+            raise
+
+        buffer = memoryview(self._mmap)
+        offset = HEADER.size
+        self._views = [buffer]
+        self.labels = self._table(buffer, offset, nodes, "I")
+        self.first_child = self._table(buffer, offset + 4 * nodes, nodes, "i")
+        self.next_sibling = self._table(buffer, offset + 8 * nodes, nodes, "i")
+        self.terminal = self._table(buffer, offset + 12 * nodes, nodes, "B")
+        self.root = 0
+        self.size = words
+
+    def _table(self, buffer, offset, count, fmt):
+        view = buffer[offset:offset + count * struct.calcsize(fmt)].cast(fmt)
+        self._views.append(view)
+        return view
+
+    def __len__(self):
+        return self.size
+
+    # Lookups only read the tables, so they are shared with PackedTrie
+    step = PackedTrie.step
+    is_word = PackedTrie.is_word
+    search = PackedTrie.search
+    starts_with = PackedTrie.starts_with
+    node_count = PackedTrie.node_count
+
+    def insert(self, word):
+        raise TypeError("snapshot tries are read-only")
+
+    def close(self):
+        """Releases the mapping; the trie must not be used afterwards"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load_snapshot(path):
+    """Maps the snapshot at path and returns it as a MappedTrie"""
+    return MappedTrie(path)
+
+
+def main():
+    if len(sys.argv) != 3:
+        print(__doc__.strip().splitlines()[-1])
+        sys.exit(2)
+    count = compile_snapshot(iter_dictionary(sys.argv[1]), sys.argv[2])
+    print(f"wrote {count} words to {sys.argv[2]}")
+
+
+if __name__ == "__main__":
+    main()